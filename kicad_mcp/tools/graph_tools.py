@@ -2,6 +2,7 @@
 Netlist extraction, graph creation anf analysis of project
 """
 
+import asyncio
 import json
 import os
 import urllib.parse
@@ -19,7 +20,7 @@ from kicad_mcp.utils.svg_file_server import IMAGE_VIEW_URI, FILE_SERVER_PORT, st
 project_cache: Dict[str, Dict[str, Any]] = {}
 
 
-def get_data(project_path: str, schematic_path: str) -> tuple[CircuitGraph, Dict]:
+async def get_data_async(project_path: str, schematic_path: str) -> tuple[CircuitGraph, Dict]:
     """
     Get a cached circuit graph or create a new one if it does not exist or has changed.
 
@@ -27,6 +28,9 @@ def get_data(project_path: str, schematic_path: str) -> tuple[CircuitGraph, Dict
     logical CircuitGraph. If the file hasn't changed, the 
     cached graph is returned immediately.
 
+    kicad-cli runs as an asyncio subprocess and the graph is built in a worker
+    thread, so the event loop keeps serving other requests during an export.
+
     Args:
         project_path (str): Absolute or relative path to the KiCad project directory.
         schematic_path (str): Path to the specific KiCad schematic file (.kicad_sch).
@@ -42,7 +46,7 @@ def get_data(project_path: str, schematic_path: str) -> tuple[CircuitGraph, Dict
     # Check if cache and file hasn't been modified
     if cache_key in project_cache:
         cached = project_cache[cache_key]
-        current_hash = hash_file(schematic_path)
+        current_hash = await asyncio.to_thread(hash_file, schematic_path)
 
         if cached["hash"] == current_hash:
             return cached["graph"], cached["structured_data"]
@@ -51,12 +55,13 @@ def get_data(project_path: str, schematic_path: str) -> tuple[CircuitGraph, Dict
 
     # Parse and create new graph
     parser = NetlistParser(schematic_path)
-    parser.export_netlist()
-    structured_data = parser.structure_data()
-    graph = CircuitGraph(structured_data, project_path)
+    # the server keeps exports and parsed netlists on disk across restarts
+    await parser.export_netlist_async(use_cache=True)
+    structured_data = await asyncio.to_thread(parser.structure_data, use_cache=True)
+    graph = await asyncio.to_thread(CircuitGraph, structured_data, project_path)
 
     if current_hash is None:
-        current_hash = hash_file(schematic_path)
+        current_hash = await asyncio.to_thread(hash_file, schematic_path)
 
     # Cache the results
     project_cache[cache_key] = {
@@ -111,14 +116,14 @@ def register_graph_tools(mcp: FastMCP) -> None:
             if not os.path.exists(schematic_path):
                 return {"success": False, "error": f"Schematic file not found: {schematic_path}"}
 
-            graph, _ = get_data(project_path, schematic_path)
+            graph, _ = await get_data_async(project_path, schematic_path)
 
             if not graph.nodes:
                 return {"success": False, "error": "No components found in schematic"}
 
             response = {
                 "success": True,
-                "nodes": graph.nodes,
+                "nodes": {name: dict(node) for name, node in graph.nodes.items()},
                 "adjacency_list": graph.adjacency_list,
             }
 
@@ -178,7 +183,7 @@ def register_graph_tools(mcp: FastMCP) -> None:
             return {"success": False, "error": "End component reference cannot be empty"}
 
         try:
-            graph, _ = get_data(project_path, schematic_path)
+            graph, _ = await get_data_async(project_path, schematic_path)
 
 
             path_result = graph.find_path(start_component, end_component, ignore_power, max_depth)
@@ -248,7 +253,7 @@ def register_graph_tools(mcp: FastMCP) -> None:
             return {"success": False, "error": "Start component reference cannot be empty"}
 
         try:
-            graph, _ = get_data(project_path, schematic_path)
+            graph, _ = await get_data_async(project_path, schematic_path)
 
 
             path_result = graph.get_neighborhood(center_component, ignore_power, radius)
@@ -328,7 +333,7 @@ def register_graph_tools(mcp: FastMCP) -> None:
         try:
             plot_svg_schematic(project_path)
 
-            graph, _ = get_data(project_path, schematic_path)
+            graph, _ = await get_data_async(project_path, schematic_path)
 
             path_result = graph.find_path_with_wire_segments(
                 start=start_component,
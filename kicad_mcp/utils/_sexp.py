@@ -0,0 +1,157 @@
+"""
+Minimal S-expression reader for KiCad netlists (kicadsexpr format).
+
+Only the `(comp ...)` lists of `(components ...)` and the `(net ...)` lists of
+`(nets ...)` are materialized, as nested tuples of atoms; everything else is
+skipped. net_parser._extract turns them into the structured netlist.
+"""
+
+import re
+from typing import List, Tuple
+
+# one DFA pass over the whole buffer: parenthesis, quoted string or bare atom
+_TOKEN_RE = re.compile(r'[()]|"(?:[^"\\]|\\.)*"|[^\s()]+')
+
+# the sections that are read and the list type read from each of them
+_SECTIONS = {"components": "comp", "nets": "net"}
+
+
+class _SExpParser:
+    """Reads lists from the token list of one S-expression
+
+    The tokens are walked by index, lists are returned as tuples of atoms (quotes
+    removed) and nested tuples.
+    """
+
+    __slots__ = ("tokens", "pos", "end", "atoms")
+
+    def __init__(self, buf):
+        # file contents are decoded once as a whole, never per token; bytes-like
+        # buffers (bytearray, memoryview, mmap) are decoded without a bytes copy
+        if not isinstance(buf, str):
+            buf = str(buf, "utf-8")
+
+        self.tokens = _TOKEN_RE.findall(buf)
+        self.pos = 0
+        self.end = len(self.tokens)
+
+        # one string object per distinct atom ("passive", "Device", pin numbers, ...)
+        self.atoms = {}
+
+    def read_list(self) -> Tuple:
+        """Read the list whose '(' has already been consumed, up to its ')'"""
+        tokens = self.tokens
+        pos = self.pos
+        end = self.end
+        atoms = self.atoms
+        stack = []
+        items = []
+
+        while pos < end:
+            token = tokens[pos]
+            pos += 1
+
+            if token == "(":
+                stack.append(items)
+                items = []
+            elif token == ")":
+                if not stack:
+                    self.pos = pos
+                    return tuple(items)
+                done = tuple(items)
+                items = stack.pop()
+                items.append(done)
+            else:
+                if token[0] == '"':
+                    # like kinparse's removeQuotes: strip the quotes, keep escapes as written
+                    token = token[1:-1]
+                atom = atoms.get(token)
+                if atom is None:
+                    atom = atoms[token] = token
+                items.append(atom)
+
+        raise ValueError("Unbalanced S-expression: missing ')'")
+
+    def skip_list(self):
+        """Skip the list whose '(' has already been consumed, up to its ')'"""
+        tokens = self.tokens
+        pos = self.pos
+        end = self.end
+        depth = 1
+
+        while pos < end:
+            token = tokens[pos]
+            pos += 1
+
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+                if depth == 0:
+                    self.pos = pos
+                    return
+
+        raise ValueError("Unbalanced S-expression: missing ')'")
+
+    def next_head(self) -> str:
+        """Consume '(' and the head atom of the next list, '' at the end of the current list"""
+        tokens = self.tokens
+        pos = self.pos
+        end = self.end
+
+        # skip atoms between the lists of a section
+        while pos < end and tokens[pos] not in ("(", ")"):
+            pos += 1
+
+        if pos >= end:
+            raise ValueError("Unbalanced S-expression: missing ')'")
+
+        if tokens[pos] == ")":
+            self.pos = pos + 1
+            return ""
+        if pos + 1 >= end or tokens[pos + 1] in ("(", ")"):
+            raise ValueError("Expected an atom at the start of a list")
+
+        self.pos = pos + 2
+        head = tokens[pos + 1]
+        return head[1:-1] if head[0] == '"' else head
+
+    def parse(self) -> Tuple[List[Tuple], List[Tuple]]:
+        """Read the comp and net lists of an (export ...) netlist
+
+        Returns:
+            Tuple of the comp lists and the net lists, each without its head
+
+        Raises:
+            ValueError: the input is not an (export ...) netlist or is truncated
+        """
+        found = {"comp": [], "net": []}
+
+        # skip to the contents of the (export ...) root
+        if self.end < 2 or self.tokens[0] != "(" or self.tokens[1] not in ("export", '"export"'):
+            raise ValueError("Not a KiCad netlist: expected an (export ...) S-expression")
+        self.pos = 2
+
+        # up to the ')' of the root, next_head raises if it is missing
+        while True:
+            section = self.next_head()
+            if not section:
+                break
+
+            wanted = _SECTIONS.get(section)
+            if wanted is None:
+                self.skip_list()
+                continue
+
+            lists = found[wanted]
+            while True:
+                head = self.next_head()
+                if not head:
+                    break
+                if head == wanted:
+                    lists.append(self.read_list())
+                else:
+                    self.skip_list()
+
+        return found["comp"], found["net"]
+
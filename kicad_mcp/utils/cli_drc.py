@@ -98,9 +98,29 @@ async def run_drc_via_cli(pcb_file: str) -> Dict[str, Any]:
         return results
 
 
+# kicad-cli does not move while the server is running, so the first hit is kept
+_kicad_cli_path: Optional[str] = None
+
+
 def find_kicad_cli() -> Optional[str]:
     """Find the kicad-cli executable in the system PATH.
 
+    The first successful lookup is cached for the lifetime of the process.
+
+    Returns:
+        Path to kicad-cli if found, None otherwise
+    """
+    global _kicad_cli_path
+
+    if _kicad_cli_path is None:
+        _kicad_cli_path = _detect_kicad_cli()
+
+    return _kicad_cli_path
+
+
+def _detect_kicad_cli() -> Optional[str]:
+    """Search PATH and the common installation locations for kicad-cli.
+
     Returns:
         Path to kicad-cli if found, None otherwise
     """
@@ -1,6 +1,12 @@
+from array import array
 from collections import defaultdict, deque
-from typing import Any, Dict, List
+from collections.abc import Mapping
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
 import sys
+import threading
 
 # new Kicad API instead of pcbnew:
 from kipy import KiCad
@@ -12,7 +18,181 @@ from kiutils.schematic import Schematic
 
 from kicad_mcp.utils.wire_graph import *
 from kicad_mcp.utils.file_utils import get_project_files
+from kicad_mcp.utils.net_parser import NetPins
 
+logger = logging.getLogger(__name__)
+
+# electrical types of pins that block a path when power is ignored
+POWER_PIN_TYPES = frozenset({"power_in", "power_out"})
+
+# markers for the side of the bidirectional search that reached a node
+_FORWARD = 1
+_BACKWARD = 2
+
+
+class Node(Mapping):
+    """Attributes of a component or net node
+
+    Read like the former node dict (node["type"], {**node}), but the usual netlist
+    fields are kept in slots instead of a per node dict. Unusual fields are kept
+    in an extra dict that is only created when needed.
+    """
+
+    __slots__ = (
+        "type",
+        "lib_id",
+        "value",
+        "footprint",
+        "description",
+        "lib",
+        "name",
+        "sheet_names",
+        "_extra",
+    )
+
+    _FIELDS = frozenset(__slots__[:-1])
+
+    def __init__(self, type: str, **attrs: Any):
+        self.type = type
+        self._extra = None
+
+        for key, value in attrs.items():
+            if key in self._FIELDS and key != "type":
+                setattr(self, key, value)
+            else:
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+
+        raise KeyError(key)
+
+    def __iter__(self):
+        for key in self.__slots__[:-1]:
+            if hasattr(self, key):
+                yield key
+
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Node({dict(self)!r})"
+
+
+class Edge(Mapping):
+    """Connection of a component to a net, read like the former {"pins": ...} dict
+
+    is_power is set while the graph is built if one of the pins is a power pin.
+    """
+
+    __slots__ = ("pins", "is_power")
+
+    def __init__(self):
+        self.pins = set()
+        self.is_power = False
+
+    def __getitem__(self, key: str) -> Any:
+        if key != "pins":
+            raise KeyError(key)
+        return self.pins
+
+    def __iter__(self):
+        yield "pins"
+
+    def __len__(self) -> int:
+        return 1
+
+    def __repr__(self) -> str:
+        return f"Edge(pins={self.pins!r})"
+
+
+class _ScratchPool:
+    """Per node buffers of one graph, reused by the searches instead of allocated per call
+
+    A borrowed visited bytearray is all zero and has to be returned all zero, the
+    searches clear only the entries they set. Parent entries are only read for nodes
+    visited by the same search, they are never cleared. Concurrent searches borrow
+    separate buffers.
+    """
+
+    __slots__ = ("_size", "_free", "_lock")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._free = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def borrow(self) -> Iterator[Tuple[bytearray, array]]:
+        with self._lock:
+            buffers = self._free.pop() if self._free else None
+
+        if buffers is None:
+            buffers = (bytearray(self._size), array("i", [-1]) * self._size)
+
+        try:
+            yield buffers
+        finally:
+            with self._lock:
+                self._free.append(buffers)
+
+
+class PathResult(Mapping):
+    """Read-only result of CircuitGraph.find_path
+
+    Behaves like the result dict. success, path and path_length are set directly,
+    detailed_path, component_details and nets are only built when they are read.
+    """
+
+    _FOUND_KEYS = ("success", "path", "detailed_path", "path_length", "component_details", "nets")
+    _NOT_FOUND_KEYS = ("success", "path", "path_length")
+
+    def __init__(self, graph: "CircuitGraph", path: Optional[List[str]], path_length: int = 0):
+        self._graph = graph
+        self.success = path is not None
+        self.path = path
+        self.path_length = path_length
+        self._keys = self._FOUND_KEYS if self.success else self._NOT_FOUND_KEYS
+
+    @cached_property
+    def detailed_path(self) -> List[str]:
+        return self._graph._build_detailed_path(self.path)
+
+    @cached_property
+    def component_details(self) -> List[Dict[str, Any]]:
+        nodes = self._graph.nodes
+        return [{"ref": node, **nodes[node]} for node in self.path if nodes[node]["type"] == "component"]
+
+    @cached_property
+    def nets(self) -> List[Dict[str, Any]]:
+        nodes = self._graph.nodes
+        return [{"ref": node, **nodes[node]} for node in self.path if nodes[node]["type"] == "net"]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"PathResult({dict(self)!r})"
 
 
 class CircuitGraph:
@@ -27,10 +207,18 @@ class CircuitGraph:
         self.edges = {}
         self.adjacency_list = defaultdict(set)
         self.netlist_data = netlist_data
+
+        # results per (start, end, ignore_power, max_depth), cleared when the graph changes
+        self._find_path_cached = lru_cache(maxsize=4096)(self._find_path_impl)
+        self._search_tree_cached = lru_cache(maxsize=256)(self._search_tree)
+        self._neighborhood_cached = lru_cache(maxsize=1024)(self._neighborhood)
+        self._signal_adjacency = None
+        self._power_mask = None
         self.power_symbols = None
         self.load_powerSymbols()
 
         self._build_graph()
+        self._index_nodes()
 
         #for wire graph 
         self._build_wire_graph()
@@ -39,6 +227,24 @@ class CircuitGraph:
         self.wire_graph = GlobalWireGraph(tolerance=0.01)
         self.wire_graph.build_from_project(self.project_path)
 
+    @property
+    def power_symbols(self):
+        """Names of the power nets of the project, reassign to change them"""
+        return self._power_symbols
+
+    @power_symbols.setter
+    def power_symbols(self, power_symbols):
+        # frozen: the caches below are only cleared on assignment, an in-place
+        # change of the set would leave them stale
+        self._power_symbols = frozenset(power_symbols) if power_symbols is not None else None
+
+        # the power mask, signal adjacency and found paths depend on the power nets
+        self._power_mask = None
+        self._signal_adjacency = None
+        self._find_path_cached.cache_clear()
+        self._search_tree_cached.cache_clear()
+        self._neighborhood_cached.cache_clear()
+
     def load_powerSymbols(self):
         """loads Power Symbols once for the whole class"""
         if self.project_path and self.power_symbols is None:
@@ -46,7 +252,7 @@ class CircuitGraph:
         else:
             self.power_symbols = set()
 
-    def find_path(self, start: str, end: str, ignore_power: bool, max_depth: int = 10) -> List[str]:
+    def find_path(self, start: str, end: str, ignore_power: bool, max_depth: int = 10) -> Mapping[str, Any]:
         """Find shortest Path between two components
         Args:
             start: the component where the path should start
@@ -57,10 +263,10 @@ class CircuitGraph:
         Returns:
             List of component references forming the path
         """
-
         start = start.upper()
         end = end.upper()
 
+        # invalid input and trivial paths are answered without touching the search cache
         if start not in self.adjacency_list or end not in self.adjacency_list:
             return {
                 "success": False,
@@ -80,88 +286,236 @@ class CircuitGraph:
             }
 
         if start == end:
-            if self.nodes[start]["type"] == "component":
-                component_count = 1
-            else:
-                component_count = 0
+            node = self.nodes[start]
+            is_component = node["type"] == "component"
 
             return {
                 "success": True,
                 "path": [start],
-                "path_length": component_count,
-                "component_details": [self.nodes[start]]
-                if self.nodes[start]["type"] == "component"
-                else [],
+                "path_length": 1 if is_component else 0,
+                "component_details": [dict(node)] if is_component else [],
                 "detailed_path": [start]
             }
 
-        queue = deque([(start, [start], 1, None)])  # first Node, Path, component_count (start counts as 1)
-        visited = {start}
+        # results are cached and shared between calls, PathResult is read-only
+        return self._find_path_cached(start, end, ignore_power, max_depth)
 
-        while queue:
-            current, path, comp_count, previous_comp = queue.popleft()
+    def _find_path_impl(self, start: str, end: str, ignore_power: bool, max_depth: int) -> "PathResult":
+        """Search the path between two different, existing nodes (uncached find_path)"""
+        return self._path_result(
+            self._bidirectional_bfs(start, end, ignore_power, max_depth), max_depth
+        )
+
+    def find_paths_batch(
+        self, pairs: List[Tuple[str, str]], ignore_power: bool = True, max_depth: int = 10
+    ) -> List[Mapping[str, Any]]:
+        """Find the shortest paths for many (start, end) pairs
+
+        Pairs with the same start share one search, so querying all targets of a
+        component costs a single traversal.
 
-            # if path is longer then max_depth then skip path
-            if comp_count >= max_depth:
+        Args:
+            pairs: (start, end) references to connect
+            ignore_power: if true the only connections are found that do not contain a power net
+            max_depth: max components in path, default is set to 10
+
+        Returns:
+            One find_path result per pair, in the order of pairs
+        """
+        node_ids = self._node_ids
+        results = []
+
+        for start, end in pairs:
+            start_id = node_ids.get(start.upper())
+            end_id = node_ids.get(end.upper())
+
+            # invalid input and trivial paths are answered like in find_path
+            if start_id is None or end_id is None or start_id == end_id or max_depth == 0:
+                results.append(self.find_path(start, end, ignore_power, max_depth))
                 continue
 
-            for neighbor in self.adjacency_list[current]:
-                if neighbor in visited:
-                    continue
+            _, parent = self._search_tree_cached(start_id, ignore_power)
 
-                # if abstraction level is low ignore everything but signal connections
-                if ignore_power:
-                    # first check: is net a known kicad Power Symbol
-                    if self.nodes[neighbor]["type"] == "net":
-                        if neighbor in self.power_symbols:
-                            continue
+            if parent[end_id] == -1:
+                results.append(PathResult(self, None))  # no path
+            else:
+                path = self._node_path(_join_paths(parent, end_id, -1))
+                results.append(self._path_result(path, max_depth))
 
-                    # second check: are the components only connected over power pins?
-                    if self.is_power_edge(current, neighbor):
-                        continue
+        return results
 
-                # calculate new component count
-                new_comp_count = comp_count
-                if self.nodes[neighbor]["type"] == "component":
-                    new_comp_count = new_comp_count + 1
+    def _path_result(self, path: Optional[List[str]], max_depth: int) -> "PathResult":
+        """Result for a found shortest path (None if there is none), limited by max_depth"""
+        if path is not None:
+            # start counts as 1, every further component on the path adds one
+            path_length = 1 + sum(
+                1 for node in path[1:] if self.nodes[node]["type"] == "component"
+            )
 
-                new_path = path + [neighbor]
+            # the end may only be reached from a node with less than max_depth components
+            end_count = 1 if self.nodes[path[-1]]["type"] == "component" else 0
 
-                new_prev_comp = neighbor if self.nodes[neighbor]["type"] == "component" else previous_comp
+            if path_length - end_count < max_depth:
+                return PathResult(self, path, path_length)
 
+        return PathResult(self, None)  # no path
 
-                if neighbor == end:
-                    detailed_path = self._build_detailed_path(new_path)
+    def _bidirectional_bfs(
+        self, start: str, end: str, ignore_power: bool, max_depth: int
+    ) -> Optional[List[str]]:
+        """Search the shortest path between two nodes
 
-                    component_details = [
-                        {"ref": node, **self.nodes[node]}
-                        for node in new_path
-                        if self.nodes[node]["type"] == "component"
-                    ]
+        Args:
+            start: node where the path starts
+            end: node where the path ends
+            ignore_power: if true power nets and power pin connections are not traversed
+            max_depth: max components in path, longer paths are not searched
 
-                    nets = [
-                        {"ref": node, **self.nodes[node]}
-                        for node in new_path
-                        if self.nodes[node]["type"] == "net"
-                    ]
+        Returns:
+            List of nodes from start to end, None if there is no connection
+        """
+        start_id = self._node_ids[start]
+        end_id = self._node_ids[end]
 
-                    return {
-                        "success": True,
-                        "path": new_path,
-                        "detailed_path": detailed_path,
-                        "path_length": new_comp_count,
-                        "component_details": component_details,
-                        "nets": nets,
-                    }
+        # at most max_depth - 2 components may lie between start and end, components
+        # and nets alternate so this limits the number of connections on the path
+        max_hops = 2 * max_depth - (2 if self._node_is_component[start_id] else 3)
+        if max_hops < 1:
+            return None
+
+        if ignore_power:
+            power_mask = self._get_power_mask()
+
+            # a power net can never be entered, so it can not be the end of a path either
+            if power_mask[end_id]:
+                return None
+
+            offsets, neighbors = self._get_signal_adjacency()
+            start_is_power_net = power_mask[start_id] == 1
+        else:
+            offsets, neighbors = self._adjacency
+            start_is_power_net = False
+
+        # the search runs on node ids, names are only looked up for the found path
+        with self._scratch.borrow() as (visited, parent):
+            path = _bidirectional_bfs_kernel(
+                offsets, neighbors, start_id, end_id, start_is_power_net, max_hops, visited, parent
+            )
 
-                visited.add(neighbor)
-                queue.append((neighbor, new_path, new_comp_count, new_prev_comp))
+        return None if path is None else self._node_path(path)
+
+    def shortest_paths_from(self, source: str, ignore_power: bool = True) -> Dict[str, int]:
+        """Distances from one node to every node it can reach
+
+        One search answers the queries for all targets of the same source, the search
+        tree is cached per (source, ignore_power).
+
+        Args:
+            source: node where all paths start
+            ignore_power: if true power nets and power pin connections are not traversed
+
+        Returns:
+            Mapping of each reachable node to its number of connections (component-net
+            hops) from source, empty if source is not in the graph
+        """
+        source_id = self._node_ids.get(source.upper())
+        if source_id is None:
+            return {}
+
+        distance, _ = self._search_tree_cached(source_id, ignore_power)
+        node_names = self._node_names
 
         return {
-            "success": False,
-            "path": None,
-            "path_length": 0,
-        }  # no path
+            node_names[node_id]: node_distance
+            for node_id, node_distance in enumerate(distance)
+            if node_distance >= 0
+        }
+
+    def _search_tree(self, source_id: int, ignore_power: bool) -> Tuple[array, array]:
+        """BFS tree from one node (uncached, see _search_tree_cached)"""
+        if ignore_power:
+            offsets, neighbors = self._get_signal_adjacency()
+        else:
+            offsets, neighbors = self._adjacency
+
+        return _bfs_tree_kernel(offsets, neighbors, source_id)
+
+    def _get_power_mask(self) -> bytearray:
+        """One byte per node id, set for the nets of known kicad Power Symbols
+
+        Returns:
+            Mask indexed by node id, rebuilt when the power symbols change
+        """
+        if self._power_mask is None:
+            power_mask = bytearray(len(self._node_names))
+            nodes = self.nodes
+
+            for name in self.power_symbols:
+                node_id = self._node_ids.get(name)
+                if node_id is not None and name in nodes and nodes[name]["type"] == "net":
+                    power_mask[node_id] = 1
+
+            self._power_mask = power_mask
+
+        return self._power_mask
+
+    def _get_signal_adjacency(self) -> Tuple[array, array]:
+        """Adjacency without power nets and without connections over power pins
+
+        The filter is evaluated once per edge and reused by every search that ignores
+        power, it is rebuilt when the power symbols change.
+
+        Returns:
+            CSR offsets and neighbor ids of the connections that carry signals
+        """
+        if self._signal_adjacency is None:
+            node_ids = self._node_ids
+            power_mask = self._get_power_mask()
+            signal_adjacency = [[] for _ in self._node_names]
+
+            for (component_ref, net_name), edge in self.edges.items():
+                # components that are only connected over power pins
+                if edge.is_power:
+                    continue
+
+                component_id = node_ids[component_ref]
+                net_id = node_ids[net_name]
+
+                # nets of known kicad Power Symbols are never entered
+                if not power_mask[net_id]:
+                    signal_adjacency[component_id].append(net_id)
+
+                signal_adjacency[net_id].append(component_id)
+
+            self._signal_adjacency = self._to_csr(signal_adjacency)
+
+        return self._signal_adjacency
+
+    @staticmethod
+    def _to_csr(adjacency: List[List[int]]) -> Tuple[array, array]:
+        """Pack per node neighbor lists into compressed sparse row arrays
+
+        The neighbors of node i are neighbors[offsets[i]:offsets[i + 1]].
+
+        Args:
+            adjacency: neighbor ids, indexed by node id
+
+        Returns:
+            Tuple of offsets (one more than there are nodes) and neighbors
+        """
+        offsets = array("i", [0])
+        neighbors = array("i")
+
+        for node_neighbors in adjacency:
+            neighbors.extend(node_neighbors)
+            offsets.append(len(neighbors))
+
+        return offsets, neighbors
+
+    def _node_path(self, path: List[int]) -> List[str]:
+        """Translate a path of node ids back to node names"""
+        node_names = self._node_names
+        return [node_names[node] for node in path]
 
     def _build_detailed_path(self, path: List[str]) -> List[str]:
         """Build path with pin information (e.g., R1.1 -> NET1 -> R2.3)
@@ -197,6 +551,19 @@ class CircuitGraph:
         
         return detailed
 
+    def get_edge(self, node_a: str, node_b: str) -> Optional[Edge]:
+        """Edge between a component and a net, given in either order
+
+        Edges are stored once, keyed by (component, net).
+
+        Returns:
+            The Edge, None if the nodes are not connected
+        """
+        edge = self.edges.get((node_a, node_b))
+        if edge is None:
+            edge = self.edges.get((node_b, node_a))
+        return edge
+
     def get_pins_for_connection(self, component: str, net: str) -> List[str]:
         """Get pin numbers connecting a component to a net
         
@@ -205,13 +572,14 @@ class CircuitGraph:
             net: Net name (e.g., "NET1")
             
         Returns:
-            List of pin numbers (e.g., ["1", "2"])
+            List of pin numbers in ascending order (e.g., ["1", "2"])
         """
         edge_key = (component, net)
         edge_data = self.edges.get(edge_key)
         
         if edge_data and "pins" in edge_data:
-            return edge_data["pins"]
+            # numeric pins sort by value ("2" before "10")
+            return sorted(edge_data["pins"], key=lambda pin: (len(pin), pin))
         
         return []
     
@@ -235,75 +603,110 @@ class CircuitGraph:
                 "neighborhood": [],
             }
 
-        queue = deque([(component, 0)])  # start component and depth 0
-        visited = {component}
-        allNeighbors = []
+        # neighborhoods are cached, every caller gets its own list
+        return {
+            "success": True,
+            "start": component,
+            "radius": radius,
+            "neighborhood": list(self._neighborhood_cached(component, ignore_Power, radius)),
+        }
 
-        while queue:
-            currentNode, currentDepth = queue.popleft()
+    def _neighborhood(self, component: str, ignore_Power: bool, radius: int) -> Tuple[Tuple[int, str], ...]:
+        """(depth, name) of all neighbors of an existing node (uncached get_neighborhood)"""
+        # power nets and power pin connections are already left out of the signal adjacency
+        if ignore_Power:
+            offsets, neighbors = self._get_signal_adjacency()
+        else:
+            offsets, neighbors = self._adjacency
 
-            if currentDepth >= radius:
-                continue
+        node_names = self._node_names
+        node_is_component = self._node_is_component
+        power_mask = self._get_power_mask()
 
-            for neighbor in self.adjacency_list[currentNode]:
-                if neighbor in visited:
-                    continue
+        with self._scratch.borrow() as (visited, _):
+            reached = _neighborhood_kernel(
+                offsets, neighbors, node_is_component, self._node_ids[component], radius, visited
+            )
 
-                # if abstraction level is low ignore everything but signal connections
-                if ignore_Power:
-                    if self.nodes[neighbor]["type"] == "net":
-                        # first check: is net a known kicad Power Symbol
-                        if neighbor in self.power_symbols:
-                            continue
+        allNeighbors = []
+        for depth, node_id in reached:
+            # whenever Node is a component it is added to the neighbors, nets are only added if the ignore_Power flag is false
+            if node_is_component[node_id] or (not ignore_Power and power_mask[node_id]):
+                allNeighbors.append((depth, node_names[node_id]))
 
-                    # second check: are the components only connected over power pins?
-                    if self.is_power_edge(currentNode, neighbor):
-                        continue
+        return tuple(allNeighbors)
 
-                visited.add(neighbor)
+    def _build_graph(self):
+        # local names for the containers filled once per pin
+        nodes = self.nodes
+        adjacency_list = self.adjacency_list
+        edges = self.edges
 
-                # the path is only increased if the node is of type component
-                if self.nodes[neighbor]["type"] == "component":
-                    queue.append((neighbor, currentDepth + 1))
-                else:
-                    queue.append((neighbor, currentDepth))
+        for ref, attrs in self.netlist_data["components"].items():
+            nodes[ref] = Node("component", **attrs)
+            adjacency_list[ref] = set()  # initialize
 
-                # whenever Node is a component it is added to the neighbors, nets are only added if the ignore_Power flag is false
-                if (self.nodes[neighbor]["type"] == "component") or (
-                    not ignore_Power and neighbor in self.power_symbols
-                ):
-                    allNeighbors.append((currentDepth + 1, neighbor))
+        for net_name, connections in self.netlist_data["nets"].items():
+            nodes[net_name] = Node("net")
 
-        return {
-            "success": True,
-            "start": component,
-            "radius": radius,
-            "neighborhood": allNeighbors,
-        }
+            # initialize so that nodes with no edges are also in adjacency List
+            net_neighbors = adjacency_list[net_name] = set()
 
-    def _build_graph(self):
-        for ref, attrs in self.netlist_data["components"].items():
-            self.nodes[ref] = {"type": "component", **attrs}
-            self.adjacency_list[ref] = set()  # initialize
+            # parsed netlists store the pins column-wise, hand written ones as dicts
+            if isinstance(connections, NetPins):
+                rows = zip(connections.components, connections.pins, connections.electrical_types)
+            else:
+                rows = (
+                    (conn["component"], conn["pin"], conn.get("electrical_type"))
+                    for conn in connections
+                )
+
+            for comp_ref, pin, electrical_type in rows:
+                adjacency_list[comp_ref].add(net_name)  # for nets and for components
+                net_neighbors.add(comp_ref)
+
+                edge = edges.get((comp_ref, net_name))
+                if edge is None:
+                    edge = edges[comp_ref, net_name] = Edge()
+
+                # pin numbers repeat across all components, share one string per number
+                pin_num = sys.intern(pin)
+
+                # the first entry of a pin decides its electrical type (see get_pin_electrical_type)
+                if pin_num not in edge.pins:
+                    edge.pins.add(pin_num)
+                    if electrical_type in POWER_PIN_TYPES:
+                        edge.is_power = True
+
+        # the graph is not modified after the build: keep the neighbors as tuples,
+        # which are smaller than sets and serialize to JSON as they are
+        self.adjacency_list = {
+            name: tuple(neighbors) for name, neighbors in adjacency_list.items()
+        }
 
-        for net_name, connections in self.netlist_data["nets"].items():
-            self.nodes[net_name] = {"type": "net"}
-            self.adjacency_list[net_name] = (
-                set()
-            )  # initialize so that nodes with no edges are also in adjacency List
+    def _index_nodes(self):
+        """Number all nodes and store the adjacency in CSR form over node ids
 
-            for conn in connections:
-                comp_ref = conn["component"]
-                pin_num = conn["pin"]
+        Searches run on the ids, which avoids hashing node names in the inner loops.
+        """
+        self._node_names = list(self.adjacency_list)
+        self._node_ids = {name: node_id for node_id, name in enumerate(self._node_names)}
 
-                self.adjacency_list[comp_ref].add(net_name)  # for nets and for components
-                self.adjacency_list[net_name].add(comp_ref)
+        # nodes only known from a net connection count as components
+        nodes = self.nodes
+        self._node_is_component = bytearray(
+            name not in nodes or nodes[name]["type"] == "component" for name in self._node_names
+        )
 
-                edge_key = (comp_ref, net_name)
-                if edge_key not in self.edges:
-                    self.edges[edge_key] = {"pins": []}
+        self._scratch = _ScratchPool(len(self._node_names))
 
-                self.edges[edge_key]["pins"].append(pin_num)
+        node_ids = self._node_ids
+        self._adjacency = self._to_csr(
+            [
+                [node_ids[neighbor] for neighbor in self.adjacency_list[name]]
+                for name in self._node_names
+            ]
+        )
 
     ######################### Methods for Wire Graph #########################
 
@@ -319,7 +722,7 @@ class CircuitGraph:
             - wire_segments: list of all wire segments in the path 
         """
         # logic path
-        logical_result = self.find_path(start, end, ignore_power, max_depth)
+        logical_result = dict(self.find_path(start, end, ignore_power, max_depth))
         
         if not logical_result["success"]:
             logical_result["wire_segments"] = []
@@ -364,9 +767,9 @@ class CircuitGraph:
                 
             if wire_path:
                 all_wire_segments.extend(wire_path)
-                print(f"Found {len(wire_path)} wire segments: {comp_a}.{comp_b}", file=sys.stderr)
+                logger.debug("Found %d wire segments: %s.%s", len(wire_path), comp_a, comp_b)
             else:
-                print(f"No wire path: {comp_a}.{comp_b}", file=sys.stderr)
+                logger.debug("No wire path: %s.%s", comp_a, comp_b)
             
             i += 1
         
@@ -459,40 +862,12 @@ class CircuitGraph:
     def is_power_edge(self, from_node: str, to_node: str) -> bool:
         """Check if edge uses power_in or power_out pins
 
-        Looks up the electrical types from netlist data for pins on this edge.
+        The electrical types of the pins on this edge are classified once while the
+        graph is built.
         """
-        # check what is component and what is net so the edge will always be found if it exists
-        if (
-            self.nodes[from_node]["type"] == "component"
-            and not self.nodes[to_node]["type"] == "component"
-        ):
-            # Component to Net
-            component_ref = from_node
-            net_name = to_node
-        elif (
-            not self.nodes[from_node]["type"] == "component"
-            and self.nodes[to_node]["type"] == "component"
-        ):
-            # Net to Component
-            component_ref = to_node
-            net_name = from_node
-
-        # get the pin nums of the edges
-        edge_key = (component_ref, net_name)
-        edge_data = self.edges.get(edge_key)
-
-        if not edge_data:
-            return False
-
-        # check the electrical type of connection between specified net and component
-        for pin_num in edge_data.get("pins", []):
-            electrical_type = self.get_pin_electrical_type(component_ref, pin_num, net_name)
-
-            # if pin of type "power_in" or "power_out" block the path
-            if electrical_type in ["power_in", "power_out"]:
-                return True
+        edge_data = self.get_edge(from_node, to_node)
 
-        return False
+        return edge_data is not None and edge_data.is_power
 
     def get_powerSymbols(self):
         """
@@ -524,25 +899,24 @@ class CircuitGraph:
         for sch_path in schematic_paths:
             sch = Schematic.from_file(sch_path)
 
+            # Parent Value of every libSymbol, looked up once per sheet instead of
+            # scanning all libSymbols for each placed power symbol
+            lib_values = {}
+            for libsym in sch.libSymbols:
+                if libsym.entryName not in lib_values:
+                    lib_values[libsym.entryName] = _value_property(libsym)
+
             for inst in sch.schematicSymbols:
                 # only get Symbols from power Library
 
                 if inst.libId is not None and inst.libId.startswith("power:"):
                     entry = inst.entryName
 
-                    # get libsymbol with an iterator
-                    libsym = next((ls for ls in sch.libSymbols if ls.entryName == entry), None)
-
-                    if libsym is not None:
-                        # Parent Value from libSymbol
-                        for prop in libsym.properties:
-                            if prop.key == "Value":
-                                parent_value = prop.value
+                    if entry in lib_values:
+                        parent_value = lib_values[entry]
 
                         # Child Value from the instance
-                        for prop in inst.properties:
-                            if prop.key == "Value":
-                                child_value = prop.value
+                        child_value = _value_property(inst)
 
                         final_value = child_value if child_value is not None else parent_value
 
@@ -551,4 +925,267 @@ class CircuitGraph:
 
         return power_symbols
 
-    
\ No newline at end of file
+
+def _value_property(symbol) -> Optional[str]:
+    """Value property of a (lib) symbol, the last one wins like in the schematic, None if missing"""
+    value = None
+    for prop in symbol.properties:
+        if prop.key == "Value":
+            value = prop.value
+    return value
+
+
+def _bidirectional_bfs_kernel(
+    offsets: array,
+    neighbors: array,
+    start: int,
+    end: int,
+    expand_start_first: bool,
+    max_hops: int,
+    visited: Optional[bytearray] = None,
+    parent: Optional[array] = None,
+) -> Optional[List[int]]:
+    """Search the shortest path from both ends at the same time
+
+    Works only on the CSR arrays and node ids, independent of the graph object.
+    Every round expands one complete level of the smaller frontier. All edges have
+    the same weight, so the first node reached from both sides lies on a shortest path.
+
+    Args:
+        offsets: CSR offsets of the adjacency to traverse
+        neighbors: CSR neighbor ids of the adjacency to traverse
+        start: id of the node where the path starts
+        end: id of the node where the path ends
+        expand_start_first: expand the start before the backward search runs, needed
+            when start has outgoing but no incoming connections (power net as start)
+        max_hops: max connections on the path, the search stops once both sides
+            together went this deep
+        visited: all zero scratch buffer with one byte per node, zero again on return
+        parent: scratch buffer with one int per node, entries of unvisited nodes are ignored
+
+    Returns:
+        List of node ids from start to end, None if there is no connection
+    """
+    node_count = len(offsets) - 1
+
+    # side that reached a node (0 = not reached) and the node it was reached from,
+    # every node is reached by one side only so both searches share the arrays
+    if visited is None:
+        visited = bytearray(node_count)
+    if parent is None:
+        parent = array("i", [-1]) * node_count
+
+    visited[start] = _FORWARD
+    visited[end] = _BACKWARD
+    parent[start] = parent[end] = -1
+    frontier_fwd = [start]
+    frontier_bwd = [end]
+
+    # every node marked in visited, they are cleared again before returning
+    reached = [start, end]
+
+    try:
+        # levels expanded by both sides together, without a meeting every path is longer
+        levels = 0
+
+        # a start that can only be left is never met by the backward search
+        if expand_start_first:
+            levels += 1
+            frontier_fwd, meeting = _expand_level(
+                frontier_fwd, _FORWARD, visited, parent, offsets, neighbors
+            )
+            reached += frontier_fwd
+            if meeting is not None:
+                return _join_paths(parent, *meeting)
+
+        while frontier_fwd and frontier_bwd and levels < max_hops:
+            levels += 1
+
+            if len(frontier_fwd) <= len(frontier_bwd):
+                frontier_fwd, meeting = _expand_level(
+                    frontier_fwd, _FORWARD, visited, parent, offsets, neighbors
+                )
+                reached += frontier_fwd
+                if meeting is not None:
+                    return _join_paths(parent, *meeting)
+            else:
+                frontier_bwd, meeting = _expand_level(
+                    frontier_bwd, _BACKWARD, visited, parent, offsets, neighbors
+                )
+                reached += frontier_bwd
+                if meeting is not None:
+                    # the edge was found from the end side, so it points towards the start
+                    node_bwd, node_fwd = meeting
+                    return _join_paths(parent, node_fwd, node_bwd)
+
+        return None
+    finally:
+        for node in reached:
+            visited[node] = 0
+
+
+def _expand_level(
+    frontier: List[int],
+    side: int,
+    visited: bytearray,
+    parent: array,
+    offsets: array,
+    neighbors: array,
+) -> Tuple[List[int], Optional[Tuple[int, int]]]:
+    """Expand one BFS level for one side of the bidirectional search
+
+    Args:
+        frontier: nodes of the current level
+        side: _FORWARD or _BACKWARD, marks the nodes reached by this side
+        visited: side that reached each node id, updated in place
+        parent: node id each node was reached from, updated in place
+        offsets: CSR offsets of the adjacency to traverse (full or signal only)
+        neighbors: CSR neighbor ids of the adjacency to traverse
+
+    Returns:
+        Tuple of the next level and the edge (node of this side, node of the other side)
+        where both sides met, None if they did not
+    """
+    next_frontier = []
+
+    for current in frontier:
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            reached_by = visited[neighbor]
+
+            if reached_by == side:
+                continue
+
+            if reached_by:
+                return next_frontier, (current, neighbor)
+
+            visited[neighbor] = side
+            parent[neighbor] = current
+            next_frontier.append(neighbor)
+
+    return next_frontier, None
+
+
+def _neighborhood_kernel(
+    offsets: array,
+    neighbors: array,
+    node_is_component: bytearray,
+    start: int,
+    radius: int,
+    visited: Optional[bytearray] = None,
+) -> List[Tuple[int, int]]:
+    """Breadth first search of all nodes within radius components of start
+
+    Only entering a component increases the depth, nets keep the depth of the
+    component they were reached from.
+
+    Args:
+        offsets: CSR offsets of the adjacency to traverse
+        neighbors: CSR neighbor ids of the adjacency to traverse
+        node_is_component: 1 for component ids, 0 for net ids
+        start: id of the node in the middle of the neighborhood
+        radius: max depth of the reached components
+
+    Returns:
+        List of (depth, node id) of every reached node in BFS order, start excluded
+    """
+    if radius <= 0:
+        return []
+
+    if visited is None:
+        visited = bytearray(len(offsets) - 1)
+
+    queue = deque([(start, 0)])  # start component and depth 0
+    visited[start] = 1
+    reached = []
+
+    try:
+        while queue:
+            current, current_depth = queue.popleft()
+            next_depth = current_depth + 1
+
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if visited[neighbor]:
+                    continue
+
+                visited[neighbor] = 1
+                reached.append((next_depth, neighbor))
+
+                # the path is only increased if the node is of type component,
+                # components on the radius are reported but never expanded
+                if not node_is_component[neighbor]:
+                    queue.append((neighbor, current_depth))
+                elif next_depth < radius:
+                    queue.append((neighbor, next_depth))
+    finally:
+        # hand the buffer back all zero
+        visited[start] = 0
+        for _, node in reached:
+            visited[node] = 0
+
+    return reached
+
+
+def _bfs_tree_kernel(offsets: array, neighbors: array, source: int) -> Tuple[array, array]:
+    """Breadth first search from one node to all nodes it can reach
+
+    Args:
+        offsets: CSR offsets of the adjacency to traverse
+        neighbors: CSR neighbor ids of the adjacency to traverse
+        source: id of the node where the search starts
+
+    Returns:
+        Tuple of the distance (-1 if not reachable) and the parent (-1 for the source
+        and unreachable nodes) of every node id
+    """
+    node_count = len(offsets) - 1
+    distance = array("i", [-1]) * node_count
+    parent = array("i", [-1]) * node_count
+
+    distance[source] = 0
+    frontier = [source]
+    level = 0
+
+    while frontier:
+        level += 1
+        next_frontier = []
+
+        for current in frontier:
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if distance[neighbor] != -1:
+                    continue
+
+                distance[neighbor] = level
+                parent[neighbor] = current
+                next_frontier.append(neighbor)
+
+        frontier = next_frontier
+
+    return distance, parent
+
+
+def _join_paths(parent: array, node_fwd: int, node_bwd: int) -> List[int]:
+    """Join the parent chains of both searches at the edge where they met
+
+    Args:
+        parent: node id each node was reached from, -1 for start and end
+        node_fwd: node of the meeting edge reached from the start
+        node_bwd: node of the meeting edge reached from the end
+
+    Returns:
+        List of node ids from the start to the end
+    """
+    path = []
+
+    node = node_fwd
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+
+    path.reverse()
+
+    node = node_bwd
+    while node != -1:
+        path.append(node)
+        node = parent[node]
+
+    return path
@@ -1,13 +1,109 @@
-from kinparse import parse_netlist
+from kinparse import parse_netlist as kinparse_netlist
+import asyncio
+import hashlib
+import json
 import os
-from typing import Any, Dict, List
+import platform
+import re
+from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 import subprocess
+import sys
 import tempfile
 
+from kicad_mcp.utils._sexp import _SExpParser
 from kicad_mcp.utils.cli_drc import find_kicad_cli
 
 
+def _intern(value):
+    """Intern names that are used as dict keys, other values pass through"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# avoid allocating a console window for kicad-cli on Windows (0 elsewhere)
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Directory for the opt-in (use_cache) netlist caches: one .net file per exported
+# schematic state and one JSON file per netlist content hash
+if platform.system() == "Windows":
+    NETLIST_CACHE_DIR = os.path.join(
+        os.environ.get("APPDATA", os.path.expanduser("~")), "kicad_mcp", "netlist_cache"
+    )
+else:
+    NETLIST_CACHE_DIR = os.path.expanduser("~/.kicad_mcp/netlist_cache")
+
+# bump when the structured data changes, older cache files are not read anymore
+_CACHE_FORMAT = 2
+
+# file of a hierarchical sheet, "Sheet file" up to KiCad 6, "Sheetfile" since KiCad 7
+_SHEETFILE_RE = re.compile(rb'\(property\s+"Sheet ?file"\s+"((?:[^"\\]|\\.)*)"')
+_SHEETFILE_ESCAPE_RE = re.compile(rb"\\(.)")
+
+# cache files kept per kind (.json structures, .net exports), the least recently used are removed
+_CACHE_MAX_FILES = 64
+
+# component attributes, stored as one column each in the cache files
+_COMPONENT_FIELDS = ("lib_id", "value", "description", "name")
+
+
+class NetPins(Sequence):
+    """Pins of one net, stored as parallel columns instead of one dict per pin
+
+    Items read like the former pin dicts ({"component", "pin", "electrical_type"}),
+    the graph build iterates the columns directly. NetPins compare equal to any
+    sequence of those dicts; for JSON, convert with list(pins).
+    """
+
+    __slots__ = ("components", "pins", "electrical_types")
+
+    def __init__(
+        self,
+        components: Optional[List[str]] = None,
+        pins: Optional[List[str]] = None,
+        electrical_types: Optional[List[str]] = None,
+    ):
+        self.components = components if components is not None else []
+        self.pins = pins if pins is not None else []
+        self.electrical_types = electrical_types if electrical_types is not None else []
+
+    def append(self, component: str, pin: str, electrical_type: str):
+        self.components.append(component)
+        self.pins.append(pin)
+        self.electrical_types.append(electrical_type)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        return {
+            "component": self.components[index],
+            "pin": self.pins[index],
+            "electrical_type": self.electrical_types[index],
+        }
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NetPins):
+            return (
+                self.components == other.components
+                and self.pins == other.pins
+                and self.electrical_types == other.electrical_types
+            )
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    # mutable, like the lists it replaces
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"NetPins({list(self)!r})"
+
+
 class NetlistParser:
     def __init__(self, schematic_path: str):
         self.components = {}
@@ -15,71 +111,507 @@ class NetlistParser:
         self.schematic_path = schematic_path
         self.netlist = None
 
-    def export_netlist(self):
+    @classmethod
+    def from_netlist_file(cls, netlist_path: str, schematic_path: Optional[str] = None) -> "NetlistParser":
+        """Parser for an already exported netlist file, without running kicad-cli
+
+        Args:
+            netlist_path: kicadsexpr netlist (.net) written by kicad-cli
+            schematic_path: schematic the netlist was exported from, if known
+        """
+        parser = cls(schematic_path if schematic_path is not None else netlist_path)
+        with open(netlist_path, "rb") as f:
+            parser.netlist = f.read()
+        return parser
+
+    @property
+    def netlist(self) -> Optional[str]:
+        # the export keeps the raw file bytes, they are decoded on first access
+        if isinstance(self._netlist, bytes):
+            self._netlist = self._netlist.decode("utf-8")
+        return self._netlist
+
+    @netlist.setter
+    def netlist(self, value):
+        self._netlist = value
+
+    def export_netlist(self, force: bool = False, use_cache: bool = False):
+        """Export the netlist of the schematic with kicad-cli
+
+        With use_cache, exports are cached in NETLIST_CACHE_DIR per state of the
+        schematic files (see _export_cache_path), an unchanged schematic is read
+        from the cache without running kicad-cli.
+
+        Args:
+            force: run kicad-cli even if a cached export exists
+            use_cache: read and write the export cache in NETLIST_CACHE_DIR
+        """
+        cache_path = _export_cache_path(self.schematic_path) if use_cache else None
+        if not force and self._read_cached_export(cache_path):
+            return
+
         try:
             # temporary directory for output
             with tempfile.TemporaryDirectory() as temp_dir:
-                output_ext = ".net"  # standard output, kinparse works with .net
-
-                output_file = os.path.join(temp_dir, f"netlist{output_ext}")
-
-                kicad_cli = find_kicad_cli()
-                if not kicad_cli:
-                    raise FileNotFoundError(
-                        "kicad-cli not found. Ensure KiCad 9.0+ is installed and in PATH."
-                    )
-
-                cmd = [
-                    kicad_cli,
-                    "sch",
-                    "export",
-                    "netlist",
-                    "--format",
-                    "kicadsexpr",
-                    "--output",
-                    output_file,
-                    self.schematic_path,
-                ]
-
-                process = subprocess.run(cmd, capture_output=True, text=True)
-
-                if process.returncode != 0:
-                    print(f"Netlist export failed: {process.stderr.strip()}")
-
-                if not os.path.exists(output_file):
-                    print(f"Netlist file not created: {output_file}")
-
-                if output_file and os.path.exists(output_file):
-                    with open(output_file, "r") as f:
-                        self.netlist = f.read()
-                else:
-                    print("Output file does not exist")
+                output_file, cmd = self._export_command(temp_dir)
+
+                # the netlist is written to output_file, stdout is not needed and
+                # stderr is only decoded when the export failed
+                process = subprocess.run(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    creationflags=_CREATE_NO_WINDOW,
+                )
+
+                self._read_export(output_file, process.returncode, process.stderr, cache_path)
+
+        except Exception as e:
+            print(f"Error during netlist export: {str(e)}")
+
+    async def export_netlist_async(self, force: bool = False, use_cache: bool = False):
+        """export_netlist without blocking the event loop
+
+        kicad-cli runs as an asyncio subprocess, the cache key, the file reads and
+        the cache write run in worker threads.
+
+        Args:
+            force: run kicad-cli even if a cached export exists
+            use_cache: read and write the export cache in NETLIST_CACHE_DIR
+        """
+        cache_path = None
+        if use_cache:
+            cache_path = await asyncio.to_thread(_export_cache_path, self.schematic_path)
+        if (
+            not force
+            and cache_path is not None
+            and await asyncio.to_thread(self._read_cached_export, cache_path)
+        ):
+            return
+
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_file, cmd = await asyncio.to_thread(self._export_command, temp_dir)
+
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    creationflags=_CREATE_NO_WINDOW,
+                )
+                _, stderr = await process.communicate()
+
+                await asyncio.to_thread(
+                    self._read_export, output_file, process.returncode, stderr, cache_path
+                )
 
         except Exception as e:
             print(f"Error during netlist export: {str(e)}")
 
-    def structure_data(self):
-        nlst = parse_netlist(self.netlist)
-        for part in nlst.parts:
-            component_data = {
-                "lib_id": f"{part.lib}:{part.name}",
-                "value": part.value,
-                "description": part.desc,
-                "name": part.name,
-            }
+    def _read_cached_export(self, cache_path: Optional[str]) -> bool:
+        """Load a cached export into self.netlist, False if there is none"""
+        if cache_path is None:
+            return False
+
+        try:
+            with open(cache_path, "rb") as f:
+                self.netlist = f.read()
+
+            # mark as recently used for _prune_cache
+            os.utime(cache_path)
+        except OSError:
+            return False  # not exported yet
+
+        return True
+
+    def _export_command(self, output_dir: str) -> Tuple[str, List[str]]:
+        """Output file and kicad-cli command line of a netlist export into output_dir"""
+        output_ext = ".net"  # standard output, kinparse works with .net
+
+        output_file = os.path.join(output_dir, f"netlist{output_ext}")
 
-            self.components[part.ref] = component_data
+        kicad_cli = find_kicad_cli()
+        if not kicad_cli:
+            raise FileNotFoundError(
+                "kicad-cli not found. Ensure KiCad 9.0+ is installed and in PATH."
+            )
 
-        for net in nlst.nets:
-            net_pins = []
+        cmd = [
+            kicad_cli,
+            "sch",
+            "export",
+            "netlist",
+            "--format",
+            "kicadsexpr",
+            "--output",
+            output_file,
+            self.schematic_path,
+        ]
 
-            # filter not connected nets
-            if "unconnected" not in net.name:
-                for pin in net.pins:
-                    net_pins.append(
-                        {"component": pin.ref, "pin": pin.num, "electrical_type": pin.type}
-                    )
+        return output_file, cmd
 
-                self.nets[net.name] = net_pins
+    def _read_export(
+        self, output_file: str, returncode: int, stderr: bytes, cache_path: Optional[str]
+    ):
+        """Read the file written by kicad-cli and store successful exports in the cache"""
+        if returncode != 0:
+            stderr = stderr.decode(errors="replace").strip()
+            print(f"Netlist export failed: {stderr}")
+
+        if not os.path.exists(output_file):
+            print(f"Netlist file not created: {output_file}")
+
+        if output_file and os.path.exists(output_file):
+            # one binary read, no text mode decoding / newline translation
+            with open(output_file, "rb") as f:
+                self.netlist = f.read()
+
+            if cache_path is not None and returncode == 0:
+                _write_atomic(cache_path, self._netlist)
+                _prune_cache(".net")
+        else:
+            print("Output file does not exist")
+
+    def structure_data(self, use_kinparse: bool = False, use_cache: bool = False):
+        """Components and nets of the exported netlist
+
+        The result only depends on the netlist content. With use_cache it is stored
+        on disk (NETLIST_CACHE_DIR) by content hash and read back instead of parsed.
+
+        Args:
+            use_kinparse: parse with kinparse (pyparsing) instead of the tokenizer based
+                reader, never cached
+            use_cache: read and write the structure cache in NETLIST_CACHE_DIR
+
+        Returns:
+            {"components": {ref: attributes}, "nets": {name: NetPins}}. NetPins is a
+            sequence of the pin dicts that compares equal to a list of them, it is not
+            JSON serializable as it is (use list(pins)).
+        """
+        if use_kinparse or not use_cache or not isinstance(self._netlist, (bytes, str)):
+            components, nets = _structure(self.netlist, use_kinparse)
+        else:
+            # exported netlists are still bytes here, a cache hit never decodes them
+            components, nets = _cached_structure(self._netlist)
+
+        self.components.update(components)
+        self.nets.update(nets)
 
         return {"components": self.components, "nets": self.nets}
+
+    @staticmethod
+    def batch_parse(paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Export and structure several schematics in parallel worker processes
+
+        Each schematic gets its own kicad-cli run and parse, so they scale with the
+        number of cores instead of sharing one interpreter.
+
+        Args:
+            paths: schematic files
+
+        Returns:
+            structure_data result of every schematic, keyed by its path
+        """
+        if not paths:
+            return {}
+
+        max_workers = min(len(paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(_parse_one, paths)))
+
+
+def _parse_one(schematic_path: str) -> Dict[str, Any]:
+    """Export and structure one schematic, run in a batch_parse worker"""
+    parser = NetlistParser(schematic_path)
+    parser.export_netlist()
+    return parser.structure_data()
+
+
+def _structure(netlist: str, use_kinparse: bool = False) -> Tuple[Dict[str, Any], Dict[str, NetPins]]:
+    """Parse a netlist into the component dicts and the NetPins of every connected net"""
+    # the tokenizer based reader is the default, kinparse (pyparsing) stays
+    # available as a fallback for netlists it cannot handle
+    if not use_kinparse:
+        return _extract(*_SExpParser(netlist).parse())
+
+    return _structure_parts(kinparse_netlist(netlist))
+
+
+def _structure_parts(nlst) -> Tuple[Dict[str, Any], Dict[str, NetPins]]:
+    """Component dicts and NetPins from parsed part and net objects (kinparse API)"""
+    components = {}
+    nets = {}
+
+    for part in nlst.parts:
+        component_data = {
+            "lib_id": f"{part.lib}:{part.name}",
+            "value": part.value,
+            "description": part.desc,
+            "name": part.name,
+        }
+
+        components[_intern(part.ref)] = component_data
+
+    # component refs, net names, pin numbers and types repeat across the netlist
+    # and become dict keys of the graph, intern them so they compare by identity
+    for net in nlst.nets:
+        net_pins = NetPins()
+
+        # filter not connected nets
+        if "unconnected" not in net.name:
+            for pin in net.pins:
+                net_pins.append(_intern(pin.ref), _intern(pin.num), _intern(pin.type))
+
+            nets[_intern(net.name)] = net_pins
+
+    return components, nets
+
+
+def _extract(comps: List[Tuple], nets: List[Tuple]) -> Tuple[Dict[str, Any], Dict[str, NetPins]]:
+    """Component dicts and NetPins straight from the comp and net lists of _SExpParser
+
+    Same result as _structure_parts, without building part and net objects first.
+    The atoms are already shared by _SExpParser, so they are not interned again.
+    """
+    components = {}
+    net_map = {}
+
+    for comp in comps:
+        ref = value = lib = name = ""
+        desc = lib_desc = None
+
+        for item in comp:
+            if type(item) is not tuple or not item:
+                continue
+            key = item[0]
+            item_value = item[1] if len(item) > 1 else ""
+
+            if key == "ref":
+                ref = item_value
+            elif key == "value":
+                value = item_value
+            elif key == "description":
+                desc = item_value
+            elif key == "libsource":
+                for sub in item[1:]:
+                    if type(sub) is not tuple or not sub:
+                        continue
+                    sub_value = sub[1] if len(sub) > 1 else ""
+                    if sub[0] == "lib":
+                        lib = sub_value
+                    elif sub[0] == "part":
+                        name = sub_value
+                    elif sub[0] == "description":
+                        lib_desc = sub_value
+
+        # the libsource description overrides the one of the component, as in kinparse
+        if lib_desc is not None:
+            desc = lib_desc
+
+        components[ref] = {
+            "lib_id": f"{lib}:{name}",
+            "value": value,
+            "description": desc if desc is not None else "",
+            "name": name,
+        }
+
+    for net in nets:
+        net_name = ""
+        net_pins = NetPins()
+
+        for item in net:
+            if type(item) is not tuple or not item:
+                continue
+            key = item[0]
+
+            if key == "name":
+                net_name = item[1] if len(item) > 1 else ""
+            elif key == "node":
+                pin_ref = pin_num = pin_type = ""
+                for sub in item[1:]:
+                    if type(sub) is not tuple or not sub:
+                        continue
+                    sub_value = sub[1] if len(sub) > 1 else ""
+                    if sub[0] == "ref":
+                        pin_ref = sub_value
+                    elif sub[0] == "pin":
+                        pin_num = sub_value
+                    elif sub[0] == "pintype":
+                        pin_type = sub_value
+
+                net_pins.append(pin_ref, pin_num, pin_type)
+
+        # filter not connected nets
+        if "unconnected" not in net_name:
+            net_map[net_name] = net_pins
+
+    return components, net_map
+
+
+def _cached_structure(netlist) -> Tuple[Dict[str, Any], Dict[str, NetPins]]:
+    """_structure of a netlist, read from the disk cache when it was structured before
+
+    Every call returns new objects, callers may modify them.
+
+    Args:
+        netlist: netlist text, or the UTF-8 bytes of the exported file
+    """
+    raw = netlist if isinstance(netlist, bytes) else netlist.encode("utf-8")
+    key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = os.path.join(NETLIST_CACHE_DIR, f"{key}.json")
+
+    cached = _read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    components, nets = _structure(raw.decode("utf-8"))
+    _write_cache(cache_path, components, nets)
+    _prune_cache(".json")
+
+    return components, nets
+
+
+def _read_cache(cache_path: str) -> Optional[Tuple[Dict[str, Any], Dict[str, NetPins]]]:
+    """Structured netlist from a cache file, None if it is missing or unusable"""
+    intern = sys.intern
+    try:
+        # json decodes the UTF-8 bytes itself, no text mode file
+        with open(cache_path, "rb") as f:
+            data = json.loads(f.read())
+
+        # mark as recently used for _prune_cache
+        os.utime(cache_path)
+
+        if data.get("format") != _CACHE_FORMAT:
+            return None
+
+        refs, *columns = data["components"]
+        components = {
+            intern(ref): dict(zip(_COMPONENT_FIELDS, attrs))
+            for ref, *attrs in zip(refs, *columns)
+        }
+        nets = {
+            intern(name): NetPins(
+                list(map(intern, refs)),
+                list(map(intern, pins)),
+                list(map(_intern, pin_types)),
+            )
+            for name, (refs, pins, pin_types) in data["nets"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    return components, nets
+
+
+def _write_cache(cache_path: str, components: Dict[str, Any], nets: Dict[str, NetPins]):
+    """Store a structured netlist, the cache is best effort and errors are ignored"""
+    data = {
+        "format": _CACHE_FORMAT,
+        # one list per attribute instead of one object per component, the keys
+        # are not repeated for every component
+        "components": [list(components)]
+        + [[attrs[field] for attrs in components.values()] for field in _COMPONENT_FIELDS],
+        "nets": {
+            name: [net_pins.components, net_pins.pins, net_pins.electrical_types]
+            for name, net_pins in nets.items()
+        },
+    }
+
+    try:
+        # compact separators, the file is only read by _read_cache
+        content = json.dumps(data, separators=(",", ":"), check_circular=False).encode("utf-8")
+    except (TypeError, ValueError):
+        return
+
+    _write_atomic(cache_path, content)
+
+
+def _export_cache_path(schematic_path: str) -> Optional[str]:
+    """Cache file for the netlist export of a schematic in its current state
+
+    The key covers the contents of the schematic, of every sheet it references
+    (recursively, also outside its directory) and of its project file, so that a
+    changed sub-sheet also invalidates the export.
+
+    Returns:
+        Path of the cache file, None if the schematic or one of its sheets can
+        not be read
+    """
+    schematic_path = os.path.abspath(schematic_path)
+    states = []
+
+    try:
+        pending = [schematic_path]
+        seen = set()
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue  # shared sheet, e.g. two instances of the same file
+            seen.add(path)
+
+            with open(path, "rb") as f:
+                content = f.read()
+            states.append(_file_state(path, content))
+
+            # sheet files are relative to the sheet that references them
+            sheet_dir = os.path.dirname(path)
+            for match in _SHEETFILE_RE.finditer(content):
+                sheet_file = _SHEETFILE_ESCAPE_RE.sub(rb"\1", match.group(1)).decode("utf-8")
+                pending.append(os.path.normpath(os.path.join(sheet_dir, sheet_file)))
+
+        project_file = os.path.splitext(schematic_path)[0] + ".kicad_pro"
+        if os.path.exists(project_file):
+            with open(project_file, "rb") as f:
+                states.append(_file_state(project_file, f.read()))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    key = hashlib.sha1("\n".join(sorted(states)).encode("utf-8")).hexdigest()
+    return os.path.join(NETLIST_CACHE_DIR, f"{key}.net")
+
+
+def _file_state(path: str, content: bytes) -> str:
+    return f"{path}:{hashlib.blake2b(content, digest_size=16).hexdigest()}"
+
+
+def _prune_cache(suffix: str):
+    """Keep only the _CACHE_MAX_FILES most recently used cache files ending with suffix"""
+    try:
+        with os.scandir(NETLIST_CACHE_DIR) as entries:
+            files = [
+                (entry.stat().st_mtime_ns, entry.path)
+                for entry in entries
+                if entry.name.endswith(suffix)
+            ]
+    except OSError:
+        return
+
+    files.sort(reverse=True)
+    for _, path in files[_CACHE_MAX_FILES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # removed by another process or still open on Windows
+
+
+def _write_atomic(path: str, content):
+    """Write a cache file, the cache is best effort and errors are ignored"""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            f.write(content)
+
+        # readers never see a partly written file
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
@@ -0,0 +1,20 @@
+import pytest
+
+
+@pytest.fixture(scope="session")
+def sample_parsed():
+    """Expected structure_data result of tests/test_files/nets/sample_netlist_Integration.net"""
+    return {
+        "components": {
+            "C1": {
+                "lib_id": "Device:C",
+                "value": "C",
+                "description": "Unpolarized capacitor",
+                "name": "C",
+            },
+        },
+        # the unconnected-(C1-Pad1) net is filtered
+        "nets": {
+            "GND": [{"component": "C1", "pin": "2", "electrical_type": "passive"}],
+        },
+    }
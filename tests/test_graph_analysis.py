@@ -1,10 +1,72 @@
 import unittest
 from unittest.mock import patch, mock_open, MagicMock
 import tempfile
+import json
 import os
 import pytest
+from types import MappingProxyType
 
 from kicad_mcp.utils.graph_analysis import CircuitGraph
+from kicad_mcp.utils.net_parser import NetPins
+
+# netlist data shared by the tests, CircuitGraph only reads it
+
+RESISTOR = MappingProxyType(
+    {
+        "lib_id": "Device:R",
+        "value": "R",
+        "footprint": "",
+        "description": "Resistor",
+        "lib": "Device",
+        "name": "R",
+        "sheet_names": "/",
+    }
+)
+
+CAPACITOR = MappingProxyType(
+    {
+        "lib_id": "Device:C",
+        "value": "C",
+        "footprint": "",
+        "description": "Unpolarized capacitor",
+        "lib": "Device",
+        "name": "C",
+        "sheet_names": "/",
+    }
+)
+
+USB_MUX = MappingProxyType(
+    {
+        "lib_id": "Interface_USB:TS3USBCA410",
+        "value": "TS3USBCA410",
+        "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
+        "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
+        "lib": "Interface_USB",
+        "name": "TS3USBCA410",
+        "sheet_names": "/",
+    }
+)
+
+POWER_GENERAL_NETLIST = MappingProxyType(
+    {
+        "components": {"R1": RESISTOR, "R2": RESISTOR, "U1": USB_MUX, "C1": RESISTOR},
+        "nets": {
+            "GND": [{"component": "R2", "pin": "1"}, {"component": "U1", "pin": "4"}],
+            "Signal": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "12"}],
+            "Signal1": [{"component": "C1", "pin": "2"}, {"component": "R1", "pin": "2"}],
+            "VCC": [{"component": "R1", "pin": "1"}, {"component": "U1", "pin": "11"}],
+        },
+    }
+)
+
+GND_NETLIST = MappingProxyType(
+    {
+        "components": {"C1": CAPACITOR, "U1": USB_MUX},
+        "nets": {
+            "GND": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "9"}],
+        },
+    }
+)
 
 
 class TestCircuitGraph:
@@ -12,15 +74,7 @@ class TestCircuitGraph:
         """Test graph with single component and no nets"""
         netlist_data = {
             "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                }
+                "C1": CAPACITOR
             },
             "nets": {},
         }
@@ -32,29 +86,27 @@ class TestCircuitGraph:
         assert graph.nodes["C1"]["value"] == "C"
         assert len(graph.adjacency_list["C1"]) == 0
 
+    def test_node_attributes(self, tmp_path):
+        """nodes keep exactly the attributes of the netlist, also uncommon ones"""
+        netlist_data = {
+            "components": {"R1": {"value": "1k", "datasheet": "~"}},
+            "nets": {},
+        }
+
+        graph = CircuitGraph(netlist_data, str(tmp_path))
+
+        assert dict(graph.nodes["R1"]) == {"type": "component", "value": "1k", "datasheet": "~"}
+        assert "footprint" not in graph.nodes["R1"]
+        with pytest.raises(KeyError):
+            graph.nodes["R1"]["footprint"]
+
     def test_building_Graph(self, tmp_path):
         """Test building the graph with nets and components"""
 
         netlist_data = {
             "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
+                "C1": CAPACITOR,
+                "R1": RESISTOR,
             },
             "nets": {
                 "GND": [{"component": "C1", "pin": "2"}],
@@ -85,6 +137,8 @@ class TestCircuitGraph:
         assert "R1" in graph.adjacency_list["Net-(C1-Pad1)"]
         assert "C1" in graph.adjacency_list["Net-(C1-Pad1)"]
         assert "C1" in graph.adjacency_list["GND"]
+        assert sorted(graph.adjacency_list["C1"]) == ["GND", "Net-(C1-Pad1)"]
+        assert json.loads(json.dumps(graph.adjacency_list))["GND"] == ["C1"]
 
         # Check Edges
         assert ("R1", "Net-(C1-Pad1)") in graph.edges
@@ -98,15 +152,7 @@ class TestCircuitGraph:
 
         netlist_data = {
             "components": {
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                }
+                "R2": RESISTOR
             },
             "nets": {
                 "GND": [
@@ -128,7 +174,7 @@ class TestFindPath:
 
     # Function to use for Test Data
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def simple_chain_netlist(self):
         """R1 --- Net1 --- R2 --- Net2 --- R3"""
         return {
@@ -139,38 +185,14 @@ class TestFindPath:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def power_net_netlist(self):
         """Circuit with power nets"""
         return {
             "components": {
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
+                "R1": RESISTOR,
+                "R2": RESISTOR,
+                "U1": USB_MUX,
             },
             "nets": {
                 "GND": [{"component": "R2", "pin": "1"}, {"component": "U1", "pin": "4"}],
@@ -179,184 +201,143 @@ class TestFindPath:
             },
         }
 
-    def test_path_to_self_component(self, simple_chain_netlist, tmp_path):
-        """Test path from component to itself"""
+    @pytest.fixture(scope="module")
+    def power_general_netlist(self):
+        """R1 is connected to U1 over VCC and over a signal chain through C1"""
+        return POWER_GENERAL_NETLIST
+
+    # graphs shared by the tests that only query them, tests changing a graph build their own
 
-        graph = CircuitGraph(simple_chain_netlist, str(tmp_path))
+    @pytest.fixture(scope="module")
+    def simple_chain_graph(self, simple_chain_netlist, tmp_path_factory):
+        return CircuitGraph(simple_chain_netlist, str(tmp_path_factory.mktemp("simple_chain")))
 
-        result = graph.find_path("R1", "R1", True, 10)
+    @pytest.fixture(scope="module")
+    def power_net_graph(self, power_net_netlist, tmp_path_factory):
+        return CircuitGraph(power_net_netlist, str(tmp_path_factory.mktemp("power_net")))
+
+    @pytest.fixture(scope="module")
+    def power_general_graph(self, power_general_netlist, tmp_path_factory):
+        graph = CircuitGraph(power_general_netlist, str(tmp_path_factory.mktemp("power_general")))
+        graph.power_symbols = {"GND", "VCC"}
+        return graph
+
+    def test_path_to_self_component(self, simple_chain_graph):
+        """Test path from component to itself"""
+
+        result = simple_chain_graph.find_path("R1", "R1", True, 10)
 
         assert result["success"] is True
         assert result["path"] == ["R1"]
         assert result["path_length"] == 1
         assert len(result["component_details"]) == 1
 
-    def test_no_path(self, simple_chain_netlist, tmp_path):
+    def test_path_result_json(self, simple_chain_graph):
+        """Self paths and searched paths are returned by get_circuit_path as JSON"""
+
+        for start, end in (("R1", "R1"), ("R1", "R3")):
+            result = simple_chain_graph.find_path(start, end, True, 10)
+            data = json.loads(json.dumps({**result}))
+
+            assert data["path"][0] == start
+            assert data["component_details"][0]["value"] == "1k"
+
+    def test_no_path(self, simple_chain_graph):
         """Test path with non-existent component"""
 
-        graph = CircuitGraph(simple_chain_netlist, str(tmp_path))
-        result = graph.find_path("R1", "R20", False, 10)
+        result = simple_chain_graph.find_path("R1", "R20", False, 10)
 
         assert result["path"] is None
 
-    def test_simple_adjacent_path(self, simple_chain_netlist, tmp_path):
-        """Test path between adjacent components"""
-
-        graph = CircuitGraph(simple_chain_netlist, str(tmp_path))
-        result = graph.find_path("R1", "R2", True, 10)
+    @pytest.mark.parametrize(
+        "graph_name, start, end, ignore_power, expected_length, must_contain",
+        [
+            ("simple_chain_graph", "R1", "R2", True, 2, ["R1", "Net1", "R2"]),
+            ("simple_chain_graph", "R1", "R3", True, 3, ["R1", "Net1", "R2", "Net2", "R3"]),
+            # path with power nets
+            ("power_net_graph", "R1", "U1", False, 2, ["VCC"]),
+            # shortest Path is through Signal chain when Power Flag is true
+            ("power_general_graph", "R1", "U1", True, 3, ["R1", "C1", "U1"]),
+            # shortest Path is through Power when Power Flag is false
+            ("power_general_graph", "R1", "U1", False, 2, ["VCC"]),
+        ],
+        ids=["adjacent", "chain", "power_nets", "power_general_signal", "power_general_power"],
+    )
+    def test_path(self, request, graph_name, start, end, ignore_power, expected_length, must_contain):
+        """Test the shortest path between two components"""
+
+        result = request.getfixturevalue(graph_name).find_path(start, end, ignore_power, 10)
 
         assert result["success"] is True
-        assert "R1" in result["path"]
-        assert "R2" in result["path"]
-        assert "Net1" in result["path"]
-        assert result["path_length"] == 2
+        assert result["path"][0] == start
+        assert result["path"][-1] == end
+        assert result["path_length"] == expected_length
+        for node in must_contain:
+            assert node in result["path"]
 
-    def test_path(self, simple_chain_netlist, tmp_path):
-        """Test path between two components"""
+    def test_shortest_paths_from(self, simple_chain_graph, power_net_graph):
+        """distances from one source to all reachable nodes"""
 
-        graph = CircuitGraph(simple_chain_netlist, str(tmp_path))
-        result = graph.find_path("R1", "R3", True, 10)
+        distances = simple_chain_graph.shortest_paths_from("r1")
+        assert distances == {"R1": 0, "Net1": 1, "R2": 2, "Net2": 3, "R3": 4}
 
-        assert result["success"] is True
+        assert simple_chain_graph.shortest_paths_from("R20") == {}
 
-        assert result["path"][0] == "R1"
-        assert result["path"][1] == "Net1"
-        assert result["path"][2] == "R2"
-        assert result["path"][3] == "Net2"
-        assert result["path"][4] == "R3"
+        # VCC can only be passed when power is not ignored
+        assert power_net_graph.shortest_paths_from("R1", ignore_power=False)["U1"] == 2
 
-        assert result["path_length"] == 3
+    def test_find_paths_batch(self, simple_chain_graph):
+        """batch results match single queries and keep the order of the pairs"""
 
-    def test_ignore_power_nets_false(self, power_net_netlist, tmp_path):
-        """path with power nets"""
+        pairs = [("R1", "R3"), ("R1", "R2"), ("R1", "R20"), ("R3", "R3")]
+        results = simple_chain_graph.find_paths_batch(pairs, True, 10)
 
-        graph = CircuitGraph(power_net_netlist, str(tmp_path))
-        result = graph.find_path("R1", "U1", False, 10)
+        assert [result["path_length"] for result in results] == [3, 2, 0, 1]
+        assert results[0]["path"] == ["R1", "Net1", "R2", "Net2", "R3"]
+        assert results[2]["success"] is False
 
-        assert result["success"] is True
-        assert result["path_length"] == 2
-        assert "VCC" in result["path"]
+        # limited the same way as find_path
+        assert simple_chain_graph.find_paths_batch([("R1", "R3")], True, 2)[0]["success"] is False
 
-    def test_power_general(self, tmp_path):
-        netlist_data = {
-            "components": {
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
-                "C1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-            },
-            "nets": {
-                "GND": [{"component": "R2", "pin": "1"}, {"component": "U1", "pin": "4"}],
-                "Signal": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "12"}],
-                "Signal1": [{"component": "C1", "pin": "2"}, {"component": "R1", "pin": "2"}],
-                "VCC": [{"component": "R1", "pin": "1"}, {"component": "U1", "pin": "11"}],
-            },
-        }
+    def test_power_net_as_end(self, power_net_netlist, tmp_path):
+        """a power net can only be the end of a path when power is not ignored"""
 
-        graph = CircuitGraph(netlist_data, str(tmp_path))
+        graph = CircuitGraph(power_net_netlist, str(tmp_path))
         graph.power_symbols = {"GND", "VCC"}
 
-        # shortest Path is through Signal chain when Power Flag is true
-        result = graph.find_path("R1", "U1", True, 10)
-
-        assert result["success"] is True
-        assert result["path_length"] == 3
-        assert "R1" in result["path"]
-        assert "C1" in result["path"]
-        assert "U1" in result["path"]
+        result = graph.find_path("R1", "GND", True, 10)
+        assert result["success"] is False
 
-        # shortest Path is through Power when Power Flag is false
-        result = graph.find_path("R1", "U1", False, 10)
+        result = graph.find_path("R1", "GND", False, 10)
         assert result["success"] is True
+        assert result["path"][0] == "R1"
+        assert result["path"][-1] == "GND"
         assert result["path_length"] == 2
-        assert "VCC" in result["path"]
 
-    def test_max_depth_limit(self, simple_chain_netlist, tmp_path):
-        """Test max_depth parameter limits path length"""
+    def test_cached_path_invalidated(self, power_net_netlist, tmp_path):
+        """cached results are dropped when the power symbols change"""
 
-        netlist_data = {
-            "components": {
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
-                "C1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-            },
-            "nets": {
-                "GND": [{"component": "R2", "pin": "1"}, {"component": "U1", "pin": "4"}],
-                "Signal": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "12"}],
-                "Signal1": [{"component": "C1", "pin": "2"}, {"component": "R1", "pin": "2"}],
-                "VCC": [{"component": "R1", "pin": "1"}, {"component": "U1", "pin": "11"}],
-            },
-        }
+        graph = CircuitGraph(power_net_netlist, str(tmp_path))
+
+        result = graph.find_path("R1", "GND", True, 10)
+        assert result["success"] is True
+
+        # the cached result is shared and can not be changed by callers
+        assert graph.find_path("r1", "gnd", True, 10) is result
+        with pytest.raises(TypeError):
+            result["wire_segments"] = []
 
-        graph = CircuitGraph(netlist_data, str(tmp_path))
         graph.power_symbols = {"GND", "VCC"}
+        assert graph.find_path("R1", "GND", True, 10)["success"] is False
+
+        # changing the set in place would bypass the invalidation
+        with pytest.raises(AttributeError):
+            graph.power_symbols.discard("GND")
+
+    def test_max_depth_limit(self, power_general_graph):
+        """Test max_depth parameter limits path length"""
 
-        result = graph.find_path("R1", "U1", True, max_depth=1)
+        result = power_general_graph.find_path("R1", "U1", True, max_depth=1)
 
         # Path from R1 to R3 has 3 components, should be limited
         assert result["success"] is False
@@ -364,59 +345,32 @@ class TestFindPath:
         assert result["path"] is None
 
 
+    def test_max_depth_boundary(self, simple_chain_graph):
+        """a path is found up to the last allowed depth"""
+
+        assert simple_chain_graph.find_path("R1", "R3", True, 3)["success"] is True
+        assert simple_chain_graph.find_path("R1", "R3", True, 2)["success"] is False
+        assert simple_chain_graph.find_path("R3", "R1", False, 3)["path_length"] == 3
+
+
 class TestGetNeighborhood:
     """Tests for neighborhood analysis"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def gnd_netlist(self):
+        """C1 and U1 only connected over GND"""
+        return GND_NETLIST
+
+    @pytest.fixture(scope="module")
     def test_netlist(self):
         """One component is in the middle, multiple compononents are connected to it"""
         return {
             "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "C2": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
+                "C1": CAPACITOR,
+                "C2": CAPACITOR,
+                "R1": RESISTOR,
+                "R2": RESISTOR,
+                "U1": USB_MUX,
             },
             "nets": {
                 "Net-(U1-GND)": [{"component": "C2", "pin": "1"}, {"component": "U1", "pin": "9"}],
@@ -435,73 +389,17 @@ class TestGetNeighborhood:
             },
         }
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def test_netlis_radius_2(self):
         return {
             "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "C2": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "R1": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R2": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "R3": {
-                    "lib_id": "Device:R",
-                    "value": "R",
-                    "footprint": "",
-                    "description": "Resistor",
-                    "lib": "Device",
-                    "name": "R",
-                    "sheet_names": "/",
-                },
-                "C3": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
+                "C1": CAPACITOR,
+                "C2": CAPACITOR,
+                "R1": RESISTOR,
+                "R2": RESISTOR,
+                "R3": RESISTOR,
+                "C3": CAPACITOR,
+                "U1": USB_MUX,
             },
             "nets": {
                 "Net-(U1-GND)": [{"component": "C2", "pin": "1"}, {"component": "U1", "pin": "9"}],
@@ -522,19 +420,31 @@ class TestGetNeighborhood:
             },
         }
 
-    def test_component_nonexistent(self, test_netlist, tmp_path):
+    # graphs shared by the tests that only query them, tests changing a graph build their own
+
+    @pytest.fixture(scope="module")
+    def test_graph(self, test_netlist, tmp_path_factory):
+        return CircuitGraph(test_netlist, str(tmp_path_factory.mktemp("neighborhood")))
+
+    @pytest.fixture(scope="module")
+    def radius_2_graph(self, test_netlis_radius_2, tmp_path_factory):
+        return CircuitGraph(test_netlis_radius_2, str(tmp_path_factory.mktemp("radius_2")))
+
+    @pytest.fixture(scope="module")
+    def gnd_graph(self, gnd_netlist, tmp_path_factory):
+        return CircuitGraph(gnd_netlist, str(tmp_path_factory.mktemp("gnd")))
+
+    def test_component_nonexistent(self, test_graph):
         """Test neighborhood of non-existent component"""
-        graph = CircuitGraph(test_netlist, str(tmp_path))
-        result = graph.get_neighborhood("R10", False, 10)
+        result = test_graph.get_neighborhood("R10", False, 10)
 
         assert result["success"] is False
         assert result["start"] == "R10"
         assert len(result["neighborhood"]) == 0
 
-    def test_neighbors(self, test_netlist, tmp_path):
+    def test_neighbors(self, test_graph):
         """Test neighborhood of components with radius 1"""
-        graph = CircuitGraph(test_netlist, str(tmp_path))
-        result = graph.get_neighborhood("U1", False, 1)
+        result = test_graph.get_neighborhood("U1", False, 1)
 
         assert result["success"] is True
         assert result["start"] == "U1"
@@ -546,10 +456,9 @@ class TestGetNeighborhood:
         assert (1, "C1") in result["neighborhood"]
         assert (1, "C2") in result["neighborhood"]
 
-    def test_neighborhood_radius_2(self, test_netlis_radius_2, tmp_path):
+    def test_neighborhood_radius_2(self, radius_2_graph):
         """Test neighborhood of components with radius 2"""
-        graph = CircuitGraph(test_netlis_radius_2, str(tmp_path))
-        result = graph.get_neighborhood("U1", False, 2)
+        result = radius_2_graph.get_neighborhood("U1", False, 2)
 
         assert result["success"] is True
         assert result["start"] == "U1"
@@ -563,35 +472,8 @@ class TestGetNeighborhood:
         assert (2, "R3") in result["neighborhood"]
         assert (2, "C3") in result["neighborhood"]
 
-    def test_neighborhood_power_true(self, tmp_path):
-        netlist = {
-            "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
-            },
-            "nets": {
-                "GND": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "9"}],
-            },
-        }
-
-        graph = CircuitGraph(netlist, str(tmp_path))
-        result = graph.get_neighborhood("U1", True, 1)
+    def test_neighborhood_power_true(self, gnd_graph):
+        result = gnd_graph.get_neighborhood("U1", True, 1)
 
         assert result["success"] is True
         assert result["start"] == "U1"
@@ -600,34 +482,8 @@ class TestGetNeighborhood:
 
         assert "C1" not in result["neighborhood"]
 
-    def test_neighborhood_power_false(self, tmp_path):
-        netlist = {
-            "components": {
-                "C1": {
-                    "lib_id": "Device:C",
-                    "value": "C",
-                    "footprint": "",
-                    "description": "Unpolarized capacitor",
-                    "lib": "Device",
-                    "name": "C",
-                    "sheet_names": "/",
-                },
-                "U1": {
-                    "lib_id": "Interface_USB:TS3USBCA410",
-                    "value": "TS3USBCA410",
-                    "footprint": "Package_DFN_QFN:UQFN-16_1.8x2.6mm_P0.4mm",
-                    "description": "USB Type-C, SBU 3:1 multiplexer, 500MHz bandwidth, UQFN-16",
-                    "lib": "Interface_USB",
-                    "name": "TS3USBCA410",
-                    "sheet_names": "/",
-                },
-            },
-            "nets": {
-                "GND": [{"component": "C1", "pin": "1"}, {"component": "U1", "pin": "9"}],
-            },
-        }
-
-        graph = CircuitGraph(netlist, str(tmp_path))
+    def test_neighborhood_power_false(self, gnd_netlist, tmp_path):
+        graph = CircuitGraph(gnd_netlist, str(tmp_path))
         result = graph.get_neighborhood("U1", False, 1)
         graph.power_symbols = {"GND"}
 
@@ -639,6 +495,21 @@ class TestGetNeighborhood:
         assert len(result["neighborhood"]) == 1
         assert (1, "C1") in result["neighborhood"]
 
+    def test_neighborhood_cache_invalidated(self, gnd_netlist, tmp_path):
+        """cached neighborhoods follow changes of the power symbols"""
+
+        graph = CircuitGraph(gnd_netlist, str(tmp_path))
+
+        result = graph.get_neighborhood("U1", True, 1)
+        assert result["neighborhood"] == [(1, "C1")]
+
+        # every call gets its own list
+        result["neighborhood"].clear()
+        assert graph.get_neighborhood("U1", True, 1)["neighborhood"] == [(1, "C1")]
+
+        graph.power_symbols = {"GND"}
+        assert graph.get_neighborhood("U1", True, 1)["neighborhood"] == []
+
     def test_neighborhood_isolated_component(self, tmp_path):
         """Test neighborhood of isolated component"""
 
@@ -666,3 +537,19 @@ class TestEdgeCases:
         assert "R1" in graph.nodes
         assert "Net1" in graph.adjacency_list["R1"]
         assert "R1" in graph.adjacency_list["Net1"]
+        assert graph.edges[("R1", "Net1")]["pins"] == {"1"}
+
+    def test_column_net_pins(self, tmp_path):
+        """nets parsed into NetPins columns build the same graph as pin dicts"""
+
+        pins = NetPins(["R1", "R2"], ["1", "2"], ["passive", "power_in"])
+        netlist_data = {"components": {"R1": {}, "R2": {}}, "nets": {"Net1": pins}}
+        graph = CircuitGraph(netlist_data, str(tmp_path))
+
+        assert pins[1] == {"component": "R2", "pin": "2", "electrical_type": "power_in"}
+        assert graph.edges[("R2", "Net1")]["pins"] == {"2"}
+        assert graph.is_power_edge("R2", "Net1") is True
+        assert graph.is_power_edge("R1", "Net1") is False
+        assert graph.is_power_edge("Net1", "R2") is True
+        assert graph.get_edge("Net1", "R1") is graph.edges[("R1", "Net1")]
+        assert graph.get_edge("R1", "R2") is None
@@ -0,0 +1,39 @@
+import asyncio
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from kicad_mcp.tools import graph_tools
+from kicad_mcp.utils.graph_analysis import CircuitGraph
+
+NETLIST_DATA = {
+    "components": {"R1": {"value": "1k"}, "R2": {"value": "2k"}},
+    "nets": {"Net1": [{"component": "R1", "pin": "2"}, {"component": "R2", "pin": "1"}]},
+}
+
+
+class TestGetDataAsync:
+    def test_graph_cached_until_schematic_changes(self, tmp_path):
+        """the graph is built once and rebuilt when the schematic file changes"""
+        schematic = tmp_path / "test.kicad_sch"
+        schematic.write_text("(kicad_sch)")
+
+        parser = MagicMock(export_netlist_async=AsyncMock())
+        parser.structure_data.return_value = NETLIST_DATA
+
+        with patch.object(graph_tools, "project_cache", {}), patch.object(
+            graph_tools, "NetlistParser", return_value=parser
+        ) as mock_parser:
+            graph, data = asyncio.run(graph_tools.get_data_async(str(tmp_path), str(schematic)))
+            cached_graph, _ = asyncio.run(graph_tools.get_data_async(str(tmp_path), str(schematic)))
+
+            assert isinstance(graph, CircuitGraph)
+            assert data is NETLIST_DATA
+            assert cached_graph is graph
+            assert mock_parser.call_count == 1
+            parser.export_netlist_async.assert_awaited_once_with(use_cache=True)
+            parser.structure_data.assert_called_once_with(use_cache=True)
+
+            schematic.write_text("(kicad_sch (version 1))")
+            changed_graph, _ = asyncio.run(graph_tools.get_data_async(str(tmp_path), str(schematic)))
+
+            assert changed_graph is not graph
+            assert mock_parser.call_count == 2
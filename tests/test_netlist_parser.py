@@ -1,27 +1,49 @@
+import asyncio
+import json
 import unittest
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, mock_open, AsyncMock
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 import os
 import pytest
 from kinparse import parse_netlist
 
 
+from kicad_mcp.utils import net_parser
 from kicad_mcp.utils.net_parser import NetlistParser
+from kicad_mcp.utils._sexp import _SExpParser
+
+# read before any test patches builtins.open or os.path.exists
+with open("tests/test_files/nets/sample_netlist.net", "r") as f:
+    _SAMPLE_NETLIST = f.read()
+
+with open("tests/test_files/nets/sample_netlist_Integration.net", "r") as f:
+    _SAMPLE_INTEGRATION = f.read()
 
 
 class TestNetlistParser(unittest.TestCase):
     """test the functions without external dependencies"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Read the sample netlists once for all tests"""
+        cls.test_schematic_path = "/path/to/test.kicad_sch"
+
+        # Sample netlist content
+        cls.sample_netlist = _SAMPLE_NETLIST
+        cls.sample_netlist_integration = _SAMPLE_INTEGRATION
+
+    @pytest.fixture(autouse=True)
+    def _sample_parsed(self, sample_parsed):
+        """Expected result of the integration netlist (conftest.py)"""
+        self.sample_parsed = sample_parsed
+
     def setUp(self):
         """Set up test fixtures"""
         # pytest.set_trace()
-        self.test_schematic_path = "/path/to/test.kicad_sch"
         self.parser = NetlistParser(self.test_schematic_path)
 
-        # Sample netlist content
-        with open("tests/test_files/nets/sample_netlist.net", "r") as f:
-            self.sample_netlist = f.read()
-
     def test_init(self):
         """Test initialization of NetlistParser"""
         parser = NetlistParser(self.test_schematic_path)
@@ -30,6 +52,8 @@ class TestNetlistParser(unittest.TestCase):
         self.assertEqual(parser.nets, {})
         self.assertIsNone(parser.netlist)
 
+    # the mocked open would also serve the sheets and the cached export
+    @patch("kicad_mcp.utils.net_parser._export_cache_path", lambda schematic_path: None)
     @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
     @patch("subprocess.run")
     @patch("os.path.exists")
@@ -42,7 +66,7 @@ class TestNetlistParser(unittest.TestCase):
         """Test export with MOCKED external dependencies"""
         # Mock external calls
         mock_find_cli.return_value = "C:/Program Files/KiCad/9.0/bin/kicad-cli.exe"
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
+        mock_subprocess.return_value = SimpleNamespace(returncode=0, stderr=b"")
         mock_exists.return_value = True
         mock_file.return_value.read.return_value = self.sample_netlist
 
@@ -54,6 +78,125 @@ class TestNetlistParser(unittest.TestCase):
         mock_subprocess.assert_called_once()
         self.assertEqual(self.parser.netlist, self.sample_netlist)
 
+    def test_netlist_decoded_lazily(self):
+        # the export stores the file bytes, netlist decodes them on first access
+        self.parser.netlist = self.sample_netlist.encode("utf-8")
+
+        self.assertEqual(self.parser.netlist, self.sample_netlist)
+        self.assertIn("C1", self.parser.structure_data()["components"])
+
+    @patch("subprocess.run")
+    def test_from_netlist_file(self, mock_subprocess):
+        # an exported netlist file is parsed without kicad-cli
+        parser = NetlistParser.from_netlist_file("tests/test_files/nets/sample_netlist.net", self.test_schematic_path)
+
+        mock_subprocess.assert_not_called()
+        self.assertEqual(parser.schematic_path, self.test_schematic_path)
+        self.assertEqual(parser.netlist, self.sample_netlist)
+        self.assertIn("C1", parser.structure_data()["components"])
+
+    @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
+    @patch("subprocess.run")
+    def test_export_netlist_cached(self, mock_subprocess, mock_find_cli):
+        # an unchanged schematic is read from the export cache without kicad-cli
+        mock_find_cli.return_value = "/usr/bin/kicad-cli"
+
+        def write_netlist(cmd, **kwargs):
+            output_file = cmd[cmd.index("--output") + 1]
+            with open(output_file, "w") as f:
+                f.write(self.sample_netlist)
+            return SimpleNamespace(returncode=0, stderr=b"")
+
+        mock_subprocess.side_effect = write_netlist
+
+        def write_sheet(path, content):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+
+        with tempfile.TemporaryDirectory() as root_dir, tempfile.TemporaryDirectory() as cache_dir:
+            # test.kicad_sch -> sheets/io.kicad_sch -> ../../shared/power.kicad_sch
+            schematic = os.path.join(root_dir, "project", "test.kicad_sch")
+            io_sheet = os.path.join(root_dir, "project", "sheets", "io.kicad_sch")
+            power_sheet = os.path.join(root_dir, "shared", "power.kicad_sch")
+            write_sheet(schematic, '(kicad_sch (sheet (property "Sheetfile" "sheets/io.kicad_sch")))')
+            write_sheet(io_sheet, '(kicad_sch (sheet (property "Sheetfile" "../../shared/power.kicad_sch")))')
+            write_sheet(power_sheet, "(kicad_sch)")
+
+            with patch.object(net_parser, "NETLIST_CACHE_DIR", cache_dir):
+                NetlistParser(schematic).export_netlist(use_cache=True)
+                parser = NetlistParser(schematic)
+                parser.export_netlist(use_cache=True)
+
+                self.assertEqual(mock_subprocess.call_count, 1)
+                self.assertEqual(parser.netlist, self.sample_netlist)
+
+                parser.export_netlist(force=True, use_cache=True)
+                self.assertEqual(mock_subprocess.call_count, 2)
+
+                # files that are not referenced do not change the export
+                write_sheet(os.path.join(root_dir, "project", "unused.kicad_sch"), "(kicad_sch)")
+                NetlistParser(schematic).export_netlist(use_cache=True)
+                self.assertEqual(mock_subprocess.call_count, 2)
+
+                # a changed sheet outside of the project directory invalidates the export
+                write_sheet(power_sheet, "(kicad_sch (version 1))")
+                NetlistParser(schematic).export_netlist(use_cache=True)
+                self.assertEqual(mock_subprocess.call_count, 3)
+
+                # each export state is one file, the oldest are removed
+                with patch.object(net_parser, "_CACHE_MAX_FILES", 1):
+                    write_sheet(io_sheet, '(kicad_sch (sheet (property "Sheetfile" "missing.kicad_sch")))')
+                    self.assertIsNone(net_parser._export_cache_path(schematic))
+
+                    write_sheet(io_sheet, "(kicad_sch)")
+                    NetlistParser(schematic).export_netlist(use_cache=True)
+                self.assertEqual(mock_subprocess.call_count, 4)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+                # without use_cache kicad-cli always runs and nothing is stored
+                NetlistParser(schematic).export_netlist()
+                self.assertEqual(mock_subprocess.call_count, 5)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
+    def test_export_netlist_async(self, mock_find_cli):
+        # the async export runs kicad-cli as an asyncio subprocess
+        mock_find_cli.return_value = "/usr/bin/kicad-cli"
+
+        async def create_subprocess_exec(*cmd, **kwargs):
+            output_file = cmd[cmd.index("--output") + 1]
+            with open(output_file, "w") as f:
+                f.write(self.sample_netlist)
+            return SimpleNamespace(returncode=0, communicate=AsyncMock(return_value=(None, b"")))
+
+        # the file work around the subprocess runs in worker threads
+        to_thread = asyncio.to_thread
+        offloaded = []
+
+        async def record_to_thread(func, *args, **kwargs):
+            offloaded.append(func.__name__)
+            return await to_thread(func, *args, **kwargs)
+
+        with tempfile.TemporaryDirectory() as project_dir, tempfile.TemporaryDirectory() as cache_dir:
+            schematic = os.path.join(project_dir, "test.kicad_sch")
+            with open(schematic, "w") as f:
+                f.write("(kicad_sch)")
+            parser = NetlistParser(schematic)
+
+            with patch("asyncio.create_subprocess_exec", side_effect=create_subprocess_exec) as mock_exec, patch(
+                "asyncio.to_thread", side_effect=record_to_thread
+            ), patch.object(net_parser, "NETLIST_CACHE_DIR", cache_dir):
+                asyncio.run(parser.export_netlist_async(use_cache=True))
+
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        mock_exec.assert_called_once()
+        self.assertEqual(parser.netlist, self.sample_netlist)
+        self.assertEqual(
+            offloaded, ["_export_cache_path", "_read_cached_export", "_export_command", "_read_export"]
+        )
+
     @patch("builtins.print")
     @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
     def test_export_netlist_kicad_not_found(self, mock_find_cli, mock_print):
@@ -66,93 +209,225 @@ class TestNetlistParser(unittest.TestCase):
             "Error during netlist export: kicad-cli not found. Ensure KiCad 9.0+ is installed and in PATH."
         )
 
-    @patch("kicad_mcp.utils.net_parser.parse_netlist")
+    @patch("builtins.print")
+    @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
+    @patch("subprocess.run")
+    def test_export_netlist_cli_error(self, mock_subprocess, mock_find_cli, mock_print):
+        # stderr comes back as bytes and is only decoded for the error message
+        mock_find_cli.return_value = "/usr/bin/kicad-cli"
+        mock_subprocess.return_value = SimpleNamespace(returncode=1, stderr=b"Failed to load schematic\n")
+
+        self.parser.export_netlist()
+
+        mock_print.assert_any_call("Netlist export failed: Failed to load schematic")
+        self.assertIsNone(self.parser.netlist)
+
+    @patch("kicad_mcp.utils.net_parser.kinparse_netlist")
     def test_structure_data_components(self, mock_parse):
         # parsing only components
         # for the parser it has to be in a valid netlist form
 
-        mock_part1 = MagicMock()
-        mock_part1.ref = "R1"
-        mock_part1.lib = "Device"
-        mock_part1.name = "R"
-        mock_part1.value = "15"
-        mock_part1.footprint = ""
-        mock_part1.desc = "Resistor"
-
-        mock_netlist = MagicMock()
-        mock_netlist.parts = [mock_part1]
-        mock_netlist.nets = []
+        part1 = SimpleNamespace(
+            ref="R1", lib="Device", name="R", value="15", footprint="", desc="Resistor"
+        )
 
-        mock_parse.return_value = mock_netlist
-        result = self.parser.structure_data()
+        mock_parse.return_value = SimpleNamespace(parts=[part1], nets=[])
+        result = self.parser.structure_data(use_kinparse=True)
 
         self.assertIn("R1", result["components"])
         self.assertEqual(result["components"]["R1"]["lib_id"], "Device:R")
         self.assertEqual(result["components"]["R1"]["value"], "15")
 
-    @patch("kicad_mcp.utils.net_parser.parse_netlist")
+    @patch("kicad_mcp.utils.net_parser.kinparse_netlist")
     def test_structure_data_nets(self, mock_parse):
         # parsing only nets
 
-        mock_pin1 = MagicMock()
-        mock_pin1.ref = "R1"
-        mock_pin1.num = "1"
-
-        mock_pin2 = MagicMock()
-        mock_pin2.ref = "C1"
-        mock_pin2.num = "1"
+        pin1 = SimpleNamespace(ref="R1", num="1", type="passive")
+        pin2 = SimpleNamespace(ref="C1", num="1", type="passive")
+        net1 = SimpleNamespace(name="Net-(C1-Pad2)", pins=[pin1, pin2])
 
-        mock_net1 = MagicMock()
-        mock_net1.name = "Net-(C1-Pad2)"
-        mock_net1.pins = [mock_pin1, mock_pin2]
-
-        mock_netlist = MagicMock()
-        mock_netlist.parts = []
-        mock_netlist.nets = [mock_net1]
-
-        mock_parse.return_value = mock_netlist
-        result = self.parser.structure_data()
+        mock_parse.return_value = SimpleNamespace(parts=[], nets=[net1])
+        result = self.parser.structure_data(use_kinparse=True)
 
         self.assertIn("Net-(C1-Pad2)", result["nets"])
         self.assertEqual(len(result["nets"]["Net-(C1-Pad2)"]), 2)
         self.assertEqual(result["nets"]["Net-(C1-Pad2)"][0]["component"], "R1")
         self.assertEqual(result["nets"]["Net-(C1-Pad2)"][0]["pin"], "1")
 
-    @patch("kicad_mcp.utils.net_parser.parse_netlist")
+    @patch("kicad_mcp.utils.net_parser.kinparse_netlist")
     def test_structure_data_empty_netlist(self, mock_parse):
         # Test with empty netlis
 
-        mock_netlist = MagicMock()
-        mock_netlist.parts = []
-        mock_netlist.nets = []
-
-        mock_parse.return_value = mock_netlist
+        mock_parse.return_value = SimpleNamespace(parts=[], nets=[])
         self.parser.netlist = ""
 
-        result = self.parser.structure_data()
+        result = self.parser.structure_data(use_kinparse=True)
 
         self.assertEqual(result["components"], {})
         self.assertEqual(result["nets"], {})
 
     # Unit / Integration test because Kinparse is used
+    @patch("kicad_mcp.utils.net_parser._export_cache_path", lambda schematic_path: None)
     @patch("kicad_mcp.utils.net_parser.find_kicad_cli")
     @patch("subprocess.run")
     def test_workflow_mock(self, mock_subprocess, mock_find_cli):
         mock_find_cli.return_value = "/usr/bin/kicad-cli"
 
         # checks if subprocess was called
-        mock_subprocess.return_value = MagicMock(returncode=0, stderr="")
-
-        # Sample netlist content
-        with open("tests/test_files/nets/sample_netlist_Integration.net", "r") as f:
-            sample_netlist = f.read()
+        mock_subprocess.return_value = SimpleNamespace(returncode=0, stderr=b"")
 
         with patch("os.path.exists", return_value=True):
-            with patch("builtins.open", mock_open(read_data=sample_netlist)):
+            with patch("builtins.open", mock_open(read_data=_SAMPLE_INTEGRATION)):
                 parser = NetlistParser("/test/path.kicad_sch")
                 parser.export_netlist()
                 result = parser.structure_data()
 
-                self.assertIn("C1", result["components"])
-                self.assertIn("GND", result["nets"])
-                self.assertEqual(result["components"]["C1"]["value"], "C")
+        self.assertEqual(result["components"], self.sample_parsed["components"])
+        self.assertEqual(result["nets"], self.sample_parsed["nets"])
+
+    def test_batch_parse(self):
+        # one job per schematic, the results are keyed by schematic path
+        netlists = {"a.kicad_sch": self.sample_netlist, "b.kicad_sch": self.sample_netlist_integration}
+
+        def export_netlist(parser):
+            parser.netlist = netlists[parser.schematic_path]
+
+        with patch.object(net_parser, "ProcessPoolExecutor", ThreadPoolExecutor), patch.object(
+            NetlistParser, "export_netlist", autospec=True, side_effect=export_netlist
+        ):
+            results = NetlistParser.batch_parse(list(netlists))
+
+        self.assertEqual(list(results), list(netlists))
+        for path, netlist in netlists.items():
+            parser = NetlistParser(path)
+            parser.netlist = netlist
+            self.assertEqual(results[path]["components"], parser.structure_data()["components"])
+        self.assertEqual(NetlistParser.batch_parse([]), {})
+
+    def test_structure_data_cache(self):
+        # a structured netlist is read back from the disk cache instead of parsed again
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(net_parser, "NETLIST_CACHE_DIR", cache_dir):
+                self.parser.netlist = self.sample_netlist
+
+                # the cache is only used when asked for
+                self.parser.structure_data()
+                self.assertEqual(os.listdir(cache_dir), [])
+
+                expected = self.parser.structure_data(use_cache=True)
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+                parser = NetlistParser(self.test_schematic_path)
+                parser.netlist = self.sample_netlist
+                with patch("kicad_mcp.utils.net_parser._extract", side_effect=AssertionError):
+                    result = parser.structure_data(use_cache=True)
+
+                    # the exported bytes of the same netlist share the cache file
+                    parser = NetlistParser(self.test_schematic_path)
+                    parser.netlist = self.sample_netlist.encode("utf-8")
+                    from_bytes = parser.structure_data(use_cache=True)
+
+
+        self.assertEqual(result["components"], expected["components"])
+        self.assertEqual(result["nets"], expected["nets"])
+        self.assertIsInstance(result["nets"]["Net-(C1-Pad2)"], net_parser.NetPins)
+        self.assertEqual(from_bytes["components"], expected["components"])
+
+        # every parser gets its own objects, changing one result does not leak into another
+        result["components"]["C1"]["value"] = "MUTATED"
+        result["nets"]["Net-(C1-Pad2)"].append("R9", "1", "passive")
+        self.assertEqual(from_bytes["components"]["C1"]["value"], "C")
+        self.assertEqual(
+            len(from_bytes["nets"]["Net-(C1-Pad2)"]), len(expected["nets"]["Net-(C1-Pad2)"])
+        )
+
+    def test_structure_data_cache_pruned(self):
+        # only the most recently used cache files are kept
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(net_parser, "NETLIST_CACHE_DIR", cache_dir), patch.object(
+                net_parser, "_CACHE_MAX_FILES", 2
+            ):
+                for index in range(3):
+                    # same netlist with an extra section, one cache file each
+                    netlist = self.sample_netlist.replace("(export", f"(export (n {index})", 1)
+                    self.parser.netlist = netlist
+                    self.parser.structure_data(use_cache=True)
+
+                self.assertEqual(len(os.listdir(cache_dir)), 2)
+
+    def test_net_pins_equality(self):
+        # NetPins compare like the lists of pin dicts they replace
+        pins = net_parser.NetPins(["R1", "C1"], ["1", "2"], ["passive", "passive"])
+        as_list = [
+            {"component": "R1", "pin": "1", "electrical_type": "passive"},
+            {"component": "C1", "pin": "2", "electrical_type": "passive"},
+        ]
+
+        self.assertEqual(pins, as_list)
+        self.assertEqual(as_list, pins)
+        self.assertEqual(pins, net_parser.NetPins(["R1", "C1"], ["1", "2"], ["passive", "passive"]))
+        self.assertNotEqual(pins, as_list[:1])
+        self.assertNotEqual(pins, "R1")
+        self.assertEqual(json.loads(json.dumps(list(pins))), as_list)
+
+    def test_sexp_parser_matches_kinparse(self):
+        # the comp and net lists of the tokenizer based reader hold the same data as
+        # kinparse's parts and nets
+        for netlist in (self.sample_netlist, self.sample_netlist_integration):
+            components, nets = net_parser._extract(*_SExpParser(netlist).parse())
+            expected_components, expected_nets = net_parser._structure_parts(parse_netlist(netlist))
+
+            self.assertEqual(components, expected_components)
+            self.assertEqual(nets, expected_nets)
+
+    def test_structure_data_matches_kinparse(self):
+        # the fused extraction gives the same structure as the walk over kinparse's objects
+        for netlist in (self.sample_netlist, self.sample_netlist_integration):
+            fast = NetlistParser(self.test_schematic_path)
+            fast.netlist = netlist
+            expected = NetlistParser(self.test_schematic_path)
+            expected.netlist = netlist
+
+            result = fast.structure_data()
+            reference = expected.structure_data(use_kinparse=True)
+
+            self.assertEqual(result["components"], reference["components"])
+            self.assertEqual(result["nets"], reference["nets"])
+
+    def test_sexp_parser_stray_atoms(self):
+        # atoms between the lists of a section are skipped, however many there are
+        stray = " x" * 5000
+        netlist = (
+            f'(export (version "E") (components{stray} (comp (ref "R1") (value "1k")){stray})'
+            ' (nets (net (code "1") (name "N1") (node (ref "R1") (pin "1") (pintype "passive")))))'
+        )
+        components, nets = net_parser._structure(netlist)
+
+        self.assertEqual(components["R1"]["value"], "1k")
+        self.assertEqual(nets["N1"][0]["component"], "R1")
+
+    def test_sexp_parser_rejects_non_netlists(self):
+        # empty, foreign and truncated input is not read as an empty netlist
+        for text in ("", "   ", "(kicad_sch (version 1))", "export", '(export (version "E")'):
+            with self.assertRaises(ValueError, msg=repr(text)):
+                net_parser._structure(text)
+
+    def test_sexp_parser_quoted_parentheses(self):
+        # parentheses inside quoted strings belong to the atom
+        netlist = (
+            '(export (version "E") (design (source "a (b).kicad_sch"))'
+            ' (components (comp (ref "R1") (value "1k (1%)")'
+            ' (libsource (lib "Device") (part "R") (description "Resistor"))))'
+            ' (nets (net (code "1") (name "Net-(R1-Pad1)")'
+            ' (node (ref "R1") (pin "1") (pintype "passive")))))'
+        )
+        components, nets = net_parser._structure(netlist)
+
+        # any UTF-8 buffer is accepted, e.g. a view of a mapped file
+        from_buffer = net_parser._structure(memoryview(netlist.encode("utf-8")))
+        self.assertEqual(from_buffer[0], components)
+        self.assertEqual(from_buffer[1], nets)
+
+        self.assertEqual(components["R1"]["value"], "1k (1%)")
+        self.assertEqual(components["R1"]["lib_id"], "Device:R")
+        self.assertEqual(nets["Net-(R1-Pad1)"][0]["electrical_type"], "passive")
@@ -6,6 +6,8 @@ import pytest
 from kicad_mcp.utils.net_parser import NetlistParser
 
 test_schematic = "tests/test_files/schematics/glasgow.kicad_sch"
+# netlist exported from test_schematic, used instead of kicad-cli with KICAD_MCP_USE_EXPORTED=1
+test_exported_netlist = "tests/test_files/schematics/glasgow.net"
 
 
 class TestNetlistPerformance(unittest.TestCase):
@@ -20,27 +22,41 @@ class TestNetlistPerformance(unittest.TestCase):
         if not os.path.exists(self.test_schematic):
             self.skipTest(f"Schematic file not found: {self.test_schematic}")
 
-        parser = NetlistParser(self.test_schematic)
-
-        # export time
+        # export time, only the file read when the exported netlist is used; kicad-cli
+        # always runs otherwise, the export cache is not used
         start_export = time.perf_counter()
-        parser.export_netlist()
+        if os.environ.get("KICAD_MCP_USE_EXPORTED") == "1" and os.path.exists(test_exported_netlist):
+            parser = NetlistParser.from_netlist_file(test_exported_netlist, self.test_schematic)
+        else:
+            parser = NetlistParser(self.test_schematic)
+            parser.export_netlist()
         export_time = time.perf_counter() - start_export
 
-        # parse time
+        # parse time, without the structure cache
         start_parse = time.perf_counter()
         result = parser.structure_data()
         parse_time = time.perf_counter() - start_parse
 
+        # same netlist through kinparse for comparison, on its own parser so that
+        # the results are not merged
+        kinparse_parser = NetlistParser(self.test_schematic)
+        kinparse_parser.netlist = parser.netlist
+        start_kinparse = time.perf_counter()
+        kinparse_result = kinparse_parser.structure_data(use_kinparse=True)
+        kinparse_time = time.perf_counter() - start_kinparse
+
         total_time = export_time + parse_time
 
         print(f"Export (KiCad CLI): {export_time:.4f}s")
-        print(f"Parse (Kinparse):   {parse_time:.4f}s")
+        print(f"Parse (tokenizer):  {parse_time:.4f}s")
+        print(f"Parse (Kinparse):   {kinparse_time:.4f}s")
         print(f"Total:              {total_time:.4f}s")
         print(f"Components parsed:  {len(result['components'])}")
         print(f"Nets parsed:        {len(result['nets'])}")
 
         self.assertGreater(len(result["components"]), 0, "Should parse components")
+        self.assertEqual(result["components"], kinparse_result["components"])
+        self.assertEqual(result["nets"], kinparse_result["nets"])
 
 
 @pytest.fixture